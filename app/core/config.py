@@ -41,14 +41,59 @@ class Settings(BaseSettings):
     VERSION: str = "1.0.0"
     
     # AI Model Configuration
-    TRANSLATION_MODEL: str = "ai4bharat/IndicTrans2-en-indic-1B"
-    WHISPER_MODEL: str = "openai/whisper-large-v3"
+    TRANSLATION_MODEL: str = "ai4bharat/IndicTrans2-en-indic-1B"  # IndicTrans2 English -> Indic checkpoint
+    TRANSLATION_MODEL_INDIC_EN: str = "ai4bharat/IndicTrans2-indic-en-1B"  # IndicTrans2 Indic -> English checkpoint
+    TRANSLATION_MODEL_INDIC_INDIC: str = "ai4bharat/indictrans2-indic-indic-dist-320M"  # Direct Indic <-> Indic checkpoint
+    WHISPER_MODEL: str = "openai/whisper-large-v3"  # HF checkpoint for STT_BACKEND=hf_batched (multilingual)
     TTS_MODEL: str = "tts_models/multilingual/multi-dataset/xtts_v2"
+    PIPER_VOICE_DIR: str = "models/piper"  # <lang>.onnx (+ .onnx.json) Piper voices, used before gTTS
     
     # Performance Configuration
     MODEL_CACHE_SIZE: int = Field(default=3, ge=1, le=10)
     MAX_CONCURRENT_REQUESTS: int = Field(default=10, ge=1, le=100)
     REQUEST_TIMEOUT: int = Field(default=300, ge=30, le=600)  # 30s to 10min
+    PRELOAD_MODELS: bool = True  # Load translation models at startup instead of on first request
+    
+    # Translation Generation Configuration
+    TRANSLATION_NUM_BEAMS: int = Field(default=4, ge=1, le=8)
+    TRANSLATION_MAX_LENGTH: int = Field(default=1024, ge=64, le=2048)
+    TRANSLATION_LENGTH_RATIO: float = Field(default=2.0, ge=1.0, le=4.0)  # max output tokens per input token
+    INDIC_INDIC_DIRECT: bool = True  # Try the direct Indic <-> Indic model before the English bridge
+    PIVOT_NUM_BEAMS: int = Field(default=1, ge=1, le=8)  # Indic->en leg of the English bridge
+    NLLB_INDIC_INDIC: bool = True  # Try one direct NLLB pass for Indic-Indic pairs before the English pivot
+    ENCODER_CACHE_SIZE: int = Field(default=64, ge=0, le=4096)  # 0 disables the encoder-output LRU
+    TRANSLATION_CACHE_SIZE: int = Field(default=10000, ge=0, le=1000000)  # 0 disables the translation result LRU
+    TRANSLATION_MAX_BATCH_SIZE: int = Field(default=32, ge=1, le=256)
+    CPU_INT8_QUANTIZATION: bool = False  # Dynamic INT8 nn.Linear quantization for CPU seq2seq models
+    GPU_INT8_QUANTIZATION: bool = False  # bitsandbytes LLM.int8() weights for IndicTrans2 on CUDA
+    LLAMA_4BIT_QUANTIZATION: bool = True  # NF4 double-quant weights for the LLaMA causal LM on CUDA
+    TORCH_COMPILE_ENCODER: bool = False  # torch.compile the seq2seq encoder on CUDA (PyTorch 2.x)
+    ATTN_IMPLEMENTATION: str = Field(default="sdpa", pattern="^(eager|sdpa|flash_attention_2)$")
+    STATIC_KV_CACHE: bool = False  # Pre-allocated decoder KV cache on CUDA (PyTorch 2.3+, model must support it)
+    USE_CUDA_GRAPHS: bool = False  # Pad inputs to fixed length buckets + static cache so CUDA graphs can be replayed
+    TRANSLATION_MICRO_BATCHING: bool = False  # Coalesce concurrent /translate requests into batched generate calls
+    MICRO_BATCH_WAIT_MS: int = Field(default=10, ge=1, le=1000)
+    TRANSLATION_BACKEND: str = Field(default="torch", pattern="^(torch|ctranslate2|onnxruntime)$")
+    CT2_COMPUTE_TYPE: str = Field(default="auto", description="CTranslate2 compute type, e.g. int8_float16, int8, auto")
+    
+    # Speech Configuration
+    STT_BACKEND: str = Field(default="faster_whisper", pattern="^(openai|faster_whisper|hf_batched)$")
+    STT_BATCH_SIZE: int = Field(default=24, ge=1, le=128)  # 30s chunks per encoder forward (hf_batched, faster-whisper batched; 1 disables)
+    STT_CHUNK_LENGTH_S: int = Field(default=30, ge=5, le=30)
+    STT_BEAM_SIZE: int = Field(default=1, ge=1, le=10)  # decode cost scales ~linearly with beam width
+    STT_VAD: bool = True  # Silero VAD skips silent regions (faster-whisper)
+    STT_INT8: bool = True  # Dynamic INT8 Linear layers for openai-whisper on CPU (faster_whisper is always int8)
+    STT_TORCH_COMPILE: bool = False  # torch.compile the openai-whisper encoder on CUDA (autotunes during warm-up; slows the first load)
+    STT_WARMUP_PASSES: int = Field(default=2, ge=0, le=5)  # Silent decodes right after a Whisper load (0 disables)
+    STT_CONCURRENCY: int = Field(default=4, ge=1, le=16)  # STT worker threads, each with its own CUDA stream
+    # Cross-request STT batching applies ONLY to STT_BACKEND=hf_batched; it has no
+    # effect with the default faster_whisper backend or with openai
+    STT_MICRO_BATCHING: bool = True  # hf_batched only: coalesce concurrent requests into one pipeline call
+    STT_MICRO_BATCH_WAIT_MS: int = Field(default=20, ge=1, le=1000)  # hf_batched only
+    STT_MAX_REQUEST_BATCH: int = Field(default=4, ge=1, le=32)  # hf_batched only: requests per coalesced call
+    SPEECH_MODEL_CACHE_SIZE: int = Field(default=2, ge=1, le=8)  # Whisper models kept resident (LRU)
+    STT_CACHE_SIZE: int = Field(default=128, ge=0, le=10000)  # 0 disables the audio-hash transcript LRU
+    GTTS_CACHE_SIZE: int = Field(default=500, ge=0, le=100000)  # gTTS MP3s kept on disk by (text, language); 0 disables
     
     # Note: SECRET_KEY validator removed - no authentication needed
     
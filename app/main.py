@@ -9,6 +9,7 @@ from fastapi.exceptions import RequestValidationError
 from contextlib import asynccontextmanager
 import time
 import os
+import asyncio
 from app.core.config import get_settings
 from app.core.db import init_db
 from app.utils.logger import app_logger
@@ -49,6 +50,19 @@ async def lifespan(app: FastAPI):
     
     app_logger.info("Storage directories initialized")
     
+    # Preload translation models so the first request does not pay the load time
+    if settings.PRELOAD_MODELS:
+        try:
+            from app.services.nlp_engine import get_nlp_engine
+            preload_status = await asyncio.to_thread(get_nlp_engine().preload_models)
+            app_logger.info(f"Translation models preloaded: {preload_status}")
+        except Exception as e:
+            app_logger.error(f"Model preloading error: {e}")
+        
+        # Speech models load in the background so startup is not blocked on them
+        from app.services.speech_engine import get_speech_engine
+        app.state.speech_warmup = asyncio.create_task(get_speech_engine().warmup())
+    
     app_logger.info("Application startup complete")
     
     # Log server startup
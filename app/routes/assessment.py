@@ -16,7 +16,7 @@ from sqlalchemy.orm import Session
 from app.core.db import get_db
 from app.core.config import SUPPORTED_LANGUAGES, get_settings
 from app.services.assessment_processor import get_assessment_processor
-from app.services.nlp_engine import AdvancedNLPEngine
+from app.services.nlp_engine import get_nlp_engine
 from app.utils.logger import app_logger
 
 settings = get_settings()
@@ -106,7 +106,7 @@ async def translate_assessment(
         app_logger.info(f"Assessment parsed: {file_format.upper()} with {validation.get('estimated_text_fields', 0)} text fields")
         
         # Initialize NLP engine for translation
-        nlp_engine = AdvancedNLPEngine()
+        nlp_engine = get_nlp_engine()
         
         # Process assessment based on format
         if file_format == 'json':
@@ -14,7 +14,7 @@ from sqlalchemy.orm import Session
 
 from app.core.db import get_db
 from app.core.config import SUPPORTED_LANGUAGES, get_settings
-from app.services.nlp_engine import AdvancedNLPEngine
+from app.services.nlp_engine import get_nlp_engine
 from app.services.speech_engine import get_speech_engine
 from app.services.assessment_processor import get_assessment_processor
 from app.services.video_processor import get_video_processor
@@ -556,7 +556,7 @@ async def _process_integration_job(job_id: str):
 async def _process_assessment_job(file_path: str, target_lang: str, domain: str, job_id: str) -> Dict:
     """Process assessment file translation"""
     assessment_processor = get_assessment_processor()
-    nlp_engine = AdvancedNLPEngine()
+    nlp_engine = get_nlp_engine()
     
     # Determine file format
     file_ext = Path(file_path).suffix.lower()[1:]
@@ -614,7 +614,7 @@ async def _process_document_job(file_path: str, target_lang: str, domain: str, j
     
     try:
         app_logger.info(f"Starting document processing: {file_path} -> {target_lang}")
-        nlp_engine = AdvancedNLPEngine()
+        nlp_engine = get_nlp_engine()
         text_extractor = TextExtractor()
         
         # Extract text from document
@@ -670,7 +670,7 @@ async def _process_document_job(file_path: str, target_lang: str, domain: str, j
 async def _process_audio_job(file_path: str, target_lang: str, domain: str, job_id: str) -> Dict:
     """Process audio localization"""
     speech_engine = get_speech_engine()
-    nlp_engine = AdvancedNLPEngine()
+    nlp_engine = get_nlp_engine()
     
     # STT
     stt_result = await speech_engine.speech_to_text(
@@ -702,7 +702,12 @@ async def _process_audio_job(file_path: str, target_lang: str, domain: str, job_
     os.makedirs(settings.OUTPUT_DIR, exist_ok=True)
     
     import shutil
-    shutil.copy2(tts_result["output_path"], output_path)
+    try:
+        shutil.copy2(tts_result["output_path"], output_path)
+    finally:
+        # Scratch TTS output lives in tmpfs (RAM); drop it once copied
+        if os.path.exists(tts_result["output_path"]):
+            os.unlink(tts_result["output_path"])
     
     return {
         "success": True,
@@ -719,7 +724,7 @@ async def _process_video_job(file_path: str, target_lang: str, domain: str, job_
     """Process video localization"""
     video_processor = get_video_processor()
     speech_engine = get_speech_engine()
-    nlp_engine = AdvancedNLPEngine()
+    nlp_engine = get_nlp_engine()
     
     # Extract audio
     audio_result = video_processor.extract_audio_from_video(file_path)
@@ -15,7 +15,7 @@ from app.core.db import get_db
 from app.core.config import SUPPORTED_LANGUAGES, get_settings
 from app.services.video_processor import get_video_processor
 from app.services.optimized_speech_engine import get_optimized_speech_engine
-from app.services.nlp_engine import AdvancedNLPEngine
+from app.services.nlp_engine import get_nlp_engine
 from app.utils.logger import app_logger
 from app.utils.data_transfer_tracker import data_transfer_tracker
 
@@ -138,7 +138,7 @@ async def optimized_video_localization(
         
         # Step 4: Translation (optimized)
         app_logger.info(f"Step 3: Translating from {detected_language} to {target_language}...")
-        nlp_engine = AdvancedNLPEngine()
+        nlp_engine = get_nlp_engine()
         
         translation_result = await nlp_engine.translate(
             text=source_text,
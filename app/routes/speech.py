@@ -2,17 +2,18 @@
 Speech (STT/TTS) routes
 """
 import os
+import json
 import time
 import tempfile
 from pathlib import Path
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, status, Form
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from typing import Optional
 from sqlalchemy.orm import Session
 from app.core.db import get_db
 from app.core.config import SUPPORTED_LANGUAGES, get_settings
 from app.schemas.speech import STTRequest, TTSRequest, STTResponse, TTSResponse
-from app.services import speech_engine
+from app.services.speech_engine import get_speech_engine
 from app.utils.file_manager import file_manager
 from app.utils.logger import app_logger
 
@@ -20,6 +21,9 @@ settings = get_settings()
 
 router = APIRouter(prefix="/speech", tags=["Speech"])
 
+# Get service instances
+speech_engine = get_speech_engine()
+
 ALLOWED_AUDIO_FORMATS = {".wav", ".mp3", ".mp4", ".m4a", ".ogg", ".flac"}
 MAX_AUDIO_SIZE = 100 * 1024 * 1024  # 100 MB
 
@@ -65,7 +69,7 @@ async def speech_to_text(
         )
     
     # Validate language if provided
-    if language and language not in SUPPORTED_LANGUAGES and language != "en":
+    if language and language not in SUPPORTED_LANGUAGES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Language '{language}' not supported"
@@ -79,15 +83,7 @@ async def speech_to_text(
         
         app_logger.info(f"Processing STT for file: {file.filename} ({len(content)} bytes)")
         
-        # Validate audio file quality
-        validation = speech_engine.validate_audio_file(temp_audio_path)
-        if not validation.get("is_valid", True):
-            if validation.get("is_silent", False):
-                raise ValueError("Audio file appears to contain only silence or very low audio")
-            if validation.get("sample_rate", 0) < 8000:
-                raise ValueError("Audio sample rate too low (minimum 8kHz required)")
-        
-        # Perform STT directly
+        # Perform STT directly (decodes once and validates the decoded audio)
         result = await speech_engine.speech_to_text(
             audio_path=temp_audio_path,
             language=language
@@ -98,9 +94,6 @@ async def speech_to_text(
         
         app_logger.info(f"STT completed: {result['language']} detected")
         
-        # Get language name from SUPPORTED_LANGUAGES or default
-        language_name = SUPPORTED_LANGUAGES.get(result["language"], result["language"].title())
-        
         return STTResponse(
             transcript=result["text"],
             language=result["language"],
@@ -135,6 +128,78 @@ async def speech_to_text(
         )
 
 
+@router.post("/stt/stream")
+async def speech_to_text_stream(
+    file: UploadFile = File(...),
+    language: Optional[str] = Form(None)
+) -> StreamingResponse:
+    """
+    Streaming Speech-to-Text as server-sent events
+    
+    Emits a "segment" event per transcribed segment as soon as it is decoded,
+    then a "result" event carrying the final STTResponse. A closing "done"
+    event ends the stream; failures are reported as an "error" event.
+    """
+    # Validate file extension
+    file_ext = "." + file.filename.split(".")[-1].lower() if "." in file.filename else ""
+    if file_ext not in ALLOWED_AUDIO_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"Audio format not supported. Allowed: {', '.join(ALLOWED_AUDIO_FORMATS)}"
+        )
+    
+    # Check file size
+    content = await file.read()
+    if len(content) > MAX_AUDIO_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File too large. Maximum size: {MAX_AUDIO_SIZE // (1024*1024)} MB"
+        )
+    
+    # Validate language if provided
+    if language and language not in SUPPORTED_LANGUAGES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Language '{language}' not supported"
+        )
+    
+    # Save audio file temporarily; the stream removes it when it finishes
+    with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as temp_file:
+        temp_file.write(content)
+        temp_audio_path = temp_file.name
+    
+    app_logger.info(f"Processing streaming STT for file: {file.filename} ({len(content)} bytes)")
+    
+    async def event_stream():
+        try:
+            async for event in speech_engine.speech_to_text_stream(temp_audio_path, language=language):
+                if "partial" in event:
+                    yield f"event: segment\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+                    continue
+                
+                result = event["result"]
+                response = STTResponse(
+                    transcript=result["text"],
+                    language=result["language"],
+                    confidence=result["confidence"],
+                    processing_time=result["duration"],
+                    audio_duration=result["duration"]
+                )
+                yield f"event: result\ndata: {response.json()}\n\n"
+        except Exception as e:
+            app_logger.error(f"Streaming STT error: {e}")
+            yield f"event: error\ndata: {json.dumps({'detail': str(e)})}\n\n"
+        finally:
+            try:
+                os.unlink(temp_audio_path)
+            except OSError:
+                pass
+        
+        yield "event: done\ndata: {}\n\n"
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 @router.post("/tts", response_model=TTSResponse)
 async def text_to_speech(
     request: TTSRequest
@@ -171,9 +236,6 @@ async def text_to_speech(
         
         app_logger.info(f"TTS completed: {result['language']} audio generated")
         
-        # Get language name
-        language_name = SUPPORTED_LANGUAGES.get(result["language"], result["language"].title())
-        
         return TTSResponse(
             status="success",
             output_file=result["output_path"],
@@ -258,8 +320,8 @@ async def audio_localization(
         app_logger.info(f"STT completed: '{source_text[:100]}...' (Language: {detected_language})")
         
         # Step 3: Translation
-        from app.services.nlp_engine import AdvancedNLPEngine
-        nlp_engine = AdvancedNLPEngine()
+        from app.services.nlp_engine import get_nlp_engine
+        nlp_engine = get_nlp_engine()
         
         translation_result = await nlp_engine.translate(
             text=source_text,
@@ -396,15 +458,15 @@ async def generate_subtitles(
             app_logger.info(f"Translating subtitles from {detected_language} to {target_language}")
             
             # Validate target language
-            if target_language not in SUPPORTED_LANGUAGES and target_language != "en":
+            if target_language not in SUPPORTED_LANGUAGES:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Target language '{target_language}' not supported"
                 )
             
             # Import NLP engine for translation
-            from app.services.nlp_engine import AdvancedNLPEngine
-            nlp_engine = AdvancedNLPEngine()
+            from app.services.nlp_engine import get_nlp_engine
+            nlp_engine = get_nlp_engine()
             
             # Translate each segment
             translated_segments = []
@@ -555,8 +617,8 @@ async def audio_localization(
         # Initialize services using the same pattern as other routes
         from app.services.speech_engine import get_speech_engine
         speech_service = get_speech_engine()
-        from app.services.nlp_engine import AdvancedNLPEngine
-        nlp_engine = AdvancedNLPEngine()
+        from app.services.nlp_engine import get_nlp_engine
+        nlp_engine = get_nlp_engine()
         
         # Step 1: Speech-to-Text
         app_logger.info("Step 1: Converting speech to text...")
@@ -3,15 +3,17 @@ Optimized Translation Routes
 High-performance translation endpoints with proper error handling
 """
 import time
+import json
 import asyncio
 from typing import List, Dict, Any, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
 # Core dependencies
 from app.core.db import get_db
-from app.core.config import SUPPORTED_LANGUAGES
+from app.core.config import SUPPORTED_LANGUAGES, get_settings
 from app.models.file import File as FileModel
 from app.models.translation import Translation as TranslationModel
 from app.schemas.translation import (
@@ -25,6 +27,8 @@ from app.services.localization import get_localization_engine
 from app.utils.logger import app_logger
 from app.utils.text_extractor import text_extractor
 
+settings = get_settings()
+
 router = APIRouter(tags=["Translation"])  # No prefix - endpoints are at root level
 
 # Get service instances
@@ -109,7 +113,7 @@ async def translate_content(
             )
         
         # Validate source language
-        if request.source_language not in SUPPORTED_LANGUAGES and request.source_language != "en":
+        if request.source_language not in SUPPORTED_LANGUAGES:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Source language '{request.source_language}' not supported"
@@ -118,7 +122,7 @@ async def translate_content(
         # Validate target languages
         invalid_targets = [
             lang for lang in request.target_languages 
-            if lang not in SUPPORTED_LANGUAGES and lang != "en"
+            if lang not in SUPPORTED_LANGUAGES
         ]
         if invalid_targets:
             raise HTTPException(
@@ -141,7 +145,9 @@ async def translate_content(
             source_lang=request.source_language,
             target_langs=request.target_languages,
             domain=request.domain,
-            apply_localization=getattr(request, 'apply_localization', True)
+            apply_localization=getattr(request, 'apply_localization', True),
+            beam_size=request.beam_size,
+            fast=request.fast
         )
         
         # Store translation records in background
@@ -174,6 +180,62 @@ async def translate_content(
         )
 
 
+@router.post("/translate/stream")
+async def translate_stream(
+    request: TranslationRequest,
+    db: Session = Depends(get_db)
+) -> StreamingResponse:
+    """
+    Streaming translation as server-sent events
+    
+    Each target language emits "delta" events with decoded text as it is
+    generated, then a "result" event carrying the final (postprocessed and
+    localized) TranslationResponse. A closing "done" event ends the stream.
+    """
+    if not request.text and not request.file_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Either 'text' or 'file_id' must be provided"
+        )
+    
+    source_text = await _get_translation_text(request, db)
+    if len(source_text.strip()) == 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No text content found for translation"
+        )
+    
+    async def event_stream():
+        for target_lang in request.target_languages:
+            try:
+                raw_result = None
+                if request.source_language != target_lang:
+                    async for event in nlp_engine.translate_stream(
+                        source_text, request.source_language, target_lang, domain=request.domain
+                    ):
+                        if "delta" in event:
+                            payload = {"target_language": target_lang, "delta": event["delta"]}
+                            yield f"event: delta\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+                        else:
+                            raw_result = event["result"]
+                
+                translation = _build_translation_response(
+                    source_text, request.source_language, target_lang, raw_result,
+                    request.domain, request.apply_localization
+                )
+            except Exception as e:
+                app_logger.error(f"Streaming translation failed for {target_lang}: {e}")
+                translation = _error_translation_response(
+                    source_text, request.source_language, target_lang, request.domain, str(e)
+                )
+            
+            yield f"event: result\ndata: {translation.json()}\n\n"
+        
+        yield "event: done\ndata: {}\n\n"
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 @router.post("/localize/context")
 async def apply_localization(
     request: Dict[str, str]
@@ -201,7 +263,7 @@ async def apply_localization(
                 detail="Language is required"
             )
         
-        if language not in SUPPORTED_LANGUAGES and language != "en":
+        if language not in SUPPORTED_LANGUAGES:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Language '{language}' not supported. Choose from supported languages"
@@ -251,7 +313,8 @@ async def batch_translate(
         "source_language": "en", 
         "target_languages": ["hi", "bn"],
         "domain": "general",
-        "apply_localization": true
+        "apply_localization": true,
+        "fast": true
     }
     """
     # Extract parameters from request body
@@ -260,6 +323,7 @@ async def batch_translate(
     target_languages = request.get("target_languages", [])
     domain = request.get("domain", "general")
     apply_localization = request.get("apply_localization", True)
+    fast = request.get("fast", True)  # Greedy decoding; pass false for beam search
     try:
         # Validate inputs
         if not texts or len(texts) == 0:
@@ -287,7 +351,7 @@ async def batch_translate(
             )
         
         # Validate languages
-        if source_language not in SUPPORTED_LANGUAGES and source_language != "en":
+        if source_language not in SUPPORTED_LANGUAGES:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Source language '{source_language}' not supported"
@@ -295,44 +359,58 @@ async def batch_translate(
         
         # Validate target languages
         for target_lang in target_languages:
-            if target_lang not in SUPPORTED_LANGUAGES and target_lang != "en":
+            if target_lang not in SUPPORTED_LANGUAGES:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Target language '{target_lang}' not supported"
                 )
         
-        # Process batch translations
+        # Process batch translations - one fused engine call across all target languages
         all_results = []
         total_start_time = time.time()
         
-        for i, text in enumerate(texts):
-            if not text.strip():
+        indexed_texts = [(i, text) for i, text in enumerate(texts) if text.strip()]
+        batch_texts = [text for _, text in indexed_texts]
+        translations_by_index = {i: [] for i, _ in indexed_texts}
+        
+        engine_targets = [t for t in target_languages if t != source_language]
+        try:
+            raw_results_by_target = await nlp_engine.batch_translate_multi(
+                batch_texts, source_language, engine_targets, domain=domain, fast=bool(fast)
+            ) if engine_targets and batch_texts else {}
+            batch_error = None
+        except Exception as e:
+            app_logger.error(f"Batch translation failed: {e}")
+            raw_results_by_target = {}
+            batch_error = str(e)
+        
+        for target_lang in target_languages:
+            if target_lang != source_language and batch_error:
+                for i, text in indexed_texts:
+                    translations_by_index[i].append(
+                        _error_translation_response(text, source_language, target_lang, domain, batch_error)
+                    )
                 continue
-                
-            try:
-                translations = await _perform_translations(
-                    text=text,
-                    source_lang=source_language,
-                    target_langs=target_languages,
-                    domain=domain,
-                    apply_localization=apply_localization
-                )
-                
-                all_results.append({
-                    "index": i,
-                    "source_text": text,
-                    "translations": [t.dict() for t in translations],
-                    "success": True
-                })
-                
-            except Exception as e:
-                app_logger.error(f"Batch item {i} failed: {e}")
-                all_results.append({
-                    "index": i,
-                    "source_text": text,
-                    "error": str(e),
-                    "success": False
-                })
+            
+            raw_results = raw_results_by_target.get(target_lang, [None] * len(batch_texts))
+            for (i, text), raw_result in zip(indexed_texts, raw_results):
+                try:
+                    translations_by_index[i].append(_build_translation_response(
+                        text, source_language, target_lang, raw_result, domain, apply_localization
+                    ))
+                except Exception as e:
+                    app_logger.error(f"Batch item {i} failed for {target_lang}: {e}")
+                    translations_by_index[i].append(
+                        _error_translation_response(text, source_language, target_lang, domain, str(e))
+                    )
+        
+        for i, text in indexed_texts:
+            all_results.append({
+                "index": i,
+                "source_text": text,
+                "translations": [t.dict() for t in translations_by_index[i]],
+                "success": True
+            })
         
         total_duration = time.time() - total_start_time
         
@@ -396,7 +474,9 @@ async def _perform_translations(
     source_lang: str,
     target_langs: List[str],
     domain: Optional[str] = None,
-    apply_localization: bool = True
+    apply_localization: bool = True,
+    beam_size: Optional[int] = None,
+    fast: bool = False
 ) -> List[TranslationResponse]:
     """Perform optimized translations with localization"""
     
@@ -404,101 +484,132 @@ async def _perform_translations(
     
     for target_lang in target_langs:
         try:
+            raw_result = None
+            
             # Skip if source and target are the same
-            if source_lang == target_lang:
-                translation_result = {
-                    "target_language": target_lang,
-                    "translated_text": text,
-                    "confidence": 1.0,
-                    "processing_time": 0.0,
-                    "model_used": "identity",
-                    "source_language": source_lang,
-                    "source_language_name": SUPPORTED_LANGUAGES.get(source_lang, source_lang.title()),
-                    "target_language_name": SUPPORTED_LANGUAGES.get(target_lang, target_lang.title()),
-                    "domain": domain
-                }
-            else:
+            if source_lang != target_lang and settings.TRANSLATION_MICRO_BATCHING and beam_size is None and not fast:
+                # Share a batched generate call with concurrent requests
+                raw_result = await nlp_engine.translate_async(text, source_lang, target_lang, domain=domain)
+            elif source_lang != target_lang:
                 # Perform translation
                 engine_result = await nlp_engine.translate(
                     text=text,
                     source_language=source_lang,
                     target_languages=[target_lang],
-                    domain=domain
+                    domain=domain,
+                    beam_size=beam_size,
+                    fast=fast
                 )
                 
                 # Extract the single translation result
                 if engine_result["translations"] and len(engine_result["translations"]) > 0:
                     raw_result = engine_result["translations"][0]
-                    
-                    # Create properly structured result for TranslationResponse
-                    translation_result = {
-                        "target_language": target_lang,
-                        "translated_text": raw_result.get("translated_text", text),
-                        "confidence": raw_result.get("confidence_score", 0.8),
-                        "processing_time": raw_result.get("translation_time", 0.0),
-                        "model_used": raw_result.get("model_used", "Unknown"),
-                        "source_language": source_lang,
-                        "source_language_name": SUPPORTED_LANGUAGES.get(source_lang, source_lang.title()),
-                        "target_language_name": SUPPORTED_LANGUAGES.get(target_lang, target_lang.title()),
-                        "domain": domain
-                    }
-                else:
-                    # Fallback if translation failed
-                    translation_result = {
-                        "target_language": target_lang,
-                        "translated_text": text,
-                        "confidence": 0.0,
-                        "processing_time": 0.0,
-                        "model_used": "fallback",
-                        "source_language": source_lang,
-                        "source_language_name": SUPPORTED_LANGUAGES.get(source_lang, source_lang.title()),
-                        "target_language_name": SUPPORTED_LANGUAGES.get(target_lang, target_lang.title()),
-                        "domain": domain
-                    }
             
-            # Apply cultural localization if requested
-            if apply_localization and target_lang != "en" and "translated_text" in translation_result:
-                try:
-                    localization_result = localization_engine.localize_content(
-                        content=translation_result["translated_text"],
-                        source_lang=source_lang,
-                        target_lang=target_lang,
-                        domain=domain
-                    )
-                    
-                    translation_result["translated_text"] = localization_result["localized_content"]
-                    translation_result["localized"] = localization_result["changes_made"]
-                    
-                except Exception as e:
-                    app_logger.warning(f"Localization failed for {target_lang}: {e}")
-                    translation_result["localized"] = False
-            else:
-                translation_result["localized"] = False
-            
-            # Create translation response
-            translation_response = TranslationResponse(**translation_result)
-            translations.append(translation_response)
+            translations.append(_build_translation_response(
+                text, source_lang, target_lang, raw_result, domain, apply_localization
+            ))
             
         except Exception as e:
             app_logger.error(f"Translation failed for {target_lang}: {e}")
-            # Add error result
-            error_response = TranslationResponse(
-                target_language=target_lang,
-                translated_text=text,  # Fallback to original text
-                confidence=0.0,
-                processing_time=0.0,
-                model_used="error",
-                source_language=source_lang,
-                source_language_name=SUPPORTED_LANGUAGES.get(source_lang, source_lang.title()),
-                target_language_name=SUPPORTED_LANGUAGES.get(target_lang, target_lang.title()),
-                domain=domain,
-                error=str(e)
-            )
-            translations.append(error_response)
+            translations.append(_error_translation_response(text, source_lang, target_lang, domain, str(e)))
     
     return translations
 
 
+def _build_translation_response(
+    text: str,
+    source_lang: str,
+    target_lang: str,
+    raw_result: Optional[Dict[str, Any]],
+    domain: Optional[str] = None,
+    apply_localization: bool = True
+) -> TranslationResponse:
+    """Shape a single engine result into a TranslationResponse and apply localization"""
+    
+    if source_lang == target_lang:
+        translation_result = {
+            "target_language": target_lang,
+            "translated_text": text,
+            "confidence": 1.0,
+            "processing_time": 0.0,
+            "model_used": "identity",
+            "source_language": source_lang,
+            "source_language_name": SUPPORTED_LANGUAGES.get(source_lang, source_lang.title()),
+            "target_language_name": SUPPORTED_LANGUAGES.get(target_lang, target_lang.title()),
+            "domain": domain
+        }
+    elif raw_result:
+        # Create properly structured result for TranslationResponse
+        translation_result = {
+            "target_language": target_lang,
+            "translated_text": raw_result.get("translated_text", text),
+            "confidence": raw_result.get("confidence_score", 0.8),
+            "processing_time": raw_result.get("translation_time", 0.0),
+            "model_used": raw_result.get("model_used", "Unknown"),
+            "source_language": source_lang,
+            "source_language_name": SUPPORTED_LANGUAGES.get(source_lang, source_lang.title()),
+            "target_language_name": SUPPORTED_LANGUAGES.get(target_lang, target_lang.title()),
+            "domain": domain
+        }
+    else:
+        # Fallback if translation failed
+        translation_result = {
+            "target_language": target_lang,
+            "translated_text": text,
+            "confidence": 0.0,
+            "processing_time": 0.0,
+            "model_used": "fallback",
+            "source_language": source_lang,
+            "source_language_name": SUPPORTED_LANGUAGES.get(source_lang, source_lang.title()),
+            "target_language_name": SUPPORTED_LANGUAGES.get(target_lang, target_lang.title()),
+            "domain": domain
+        }
+    
+    # Apply cultural localization if requested
+    if apply_localization and target_lang != "en" and "translated_text" in translation_result:
+        try:
+            localization_result = localization_engine.localize_content(
+                content=translation_result["translated_text"],
+                source_lang=source_lang,
+                target_lang=target_lang,
+                domain=domain
+            )
+            
+            translation_result["translated_text"] = localization_result["localized_content"]
+            translation_result["localized"] = localization_result["changes_made"]
+            
+        except Exception as e:
+            app_logger.warning(f"Localization failed for {target_lang}: {e}")
+            translation_result["localized"] = False
+    else:
+        translation_result["localized"] = False
+    
+    # Create translation response
+    return TranslationResponse(**translation_result)
+
+
+def _error_translation_response(
+    text: str,
+    source_lang: str,
+    target_lang: str,
+    domain: Optional[str],
+    error: str
+) -> TranslationResponse:
+    """Error result that falls back to the original text"""
+    return TranslationResponse(
+        target_language=target_lang,
+        translated_text=text,  # Fallback to original text
+        confidence=0.0,
+        processing_time=0.0,
+        model_used="error",
+        source_language=source_lang,
+        source_language_name=SUPPORTED_LANGUAGES.get(source_lang, source_lang.title()),
+        target_language_name=SUPPORTED_LANGUAGES.get(target_lang, target_lang.title()),
+        domain=domain,
+        error=error
+    )
+
+
 async def _store_translation_records(
     file_id: int,
     translations: List[TranslationResponse],
@@ -15,7 +15,7 @@ from app.core.db import get_db
 from app.core.config import SUPPORTED_LANGUAGES, get_settings
 from app.services.video_processor import get_video_processor
 from app.services.speech_engine import get_speech_engine
-from app.services.nlp_engine import AdvancedNLPEngine
+from app.services.nlp_engine import get_nlp_engine
 from app.utils.logger import app_logger
 
 settings = get_settings()
@@ -117,7 +117,7 @@ async def video_localization(
         
         # Always use NLP engine for language detection to ensure accuracy
         app_logger.info("Using NLP engine for accurate language detection")
-        nlp_engine = AdvancedNLPEngine()
+        nlp_engine = get_nlp_engine()
         language_detection = nlp_engine.detect_language(source_text)
         detected_language = language_detection.get("detected_language", "en")
         detection_confidence = language_detection.get("confidence", 0.0)
@@ -131,7 +131,7 @@ async def video_localization(
         app_logger.info(f"STT completed: '{source_text[:100]}...' (Language: {detected_language})")
         
         # Step 4: Translate content
-        nlp_engine = AdvancedNLPEngine()
+        nlp_engine = get_nlp_engine()
         
         # Translate full text
         translation_result = await nlp_engine.translate(
@@ -15,18 +15,19 @@ class TranslationRequest(BaseModel):
     target_languages: List[str] = Field(..., min_items=1)
     domain: Optional[str] = Field(None, description="Domain for context adaptation")
     apply_localization: bool = Field(default=True, description="Apply cultural localization")
+    beam_size: Optional[int] = Field(None, ge=1, le=8, description="Beam search width (defaults to server setting)")
+    fast: bool = Field(default=False, description="Greedy decoding for lower latency")
     
     @validator("source_language")
     def validate_source_language(cls, v):
-        if v not in SUPPORTED_LANGUAGES and v != "en":
+        if v not in SUPPORTED_LANGUAGES:
             raise ValueError(f"Source language '{v}' not supported. Choose from 22 Indian languages or 'en'")
         return v
     
     @validator("target_languages")
     def validate_target_languages(cls, v):
         for lang in v:
-            # Allow English ('en') as a valid target in addition to the supported Indian languages
-            if lang != "en" and lang not in SUPPORTED_LANGUAGES:
+            if lang not in SUPPORTED_LANGUAGES:
                 raise ValueError(f"Target language '{lang}' not supported. Choose from 22 Indian languages or 'en'")
         return v
 
@@ -1,8 +1,6 @@
 """AI and service modules"""
 from .nlp_engine import AdvancedNLPEngine, get_nlp_engine
-from .speech_engine import ProductionSpeechEngine
+from .speech_engine import ProductionSpeechEngine, get_speech_engine
 
-# Global instances
-nlp_engine = AdvancedNLPEngine()
-speech_engine = ProductionSpeechEngine()
+# Engines are process-wide singletons - use get_nlp_engine() / get_speech_engine()
 
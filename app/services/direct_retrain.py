@@ -59,7 +59,7 @@ class DirectRetrainManager:
         
         # Validate languages
         for lang in languages:
-            if lang not in SUPPORTED_LANGUAGES and lang != "en":
+            if lang not in SUPPORTED_LANGUAGES:
                 raise ValueError(f"Language '{lang}' not supported")
         
         app_logger.info(f"Starting retraining for domain: {domain}, epochs: {epochs}")
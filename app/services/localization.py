@@ -309,7 +309,7 @@ class OptimizedLocalizationEngine:
             Localization result with metadata
         """
         try:
-            if target_lang not in SUPPORTED_LANGUAGES and target_lang != "en":
+            if target_lang not in SUPPORTED_LANGUAGES:
                 raise ValueError(f"Target language '{target_lang}' not supported")
             
             # Apply cultural adaptations
@@ -6,7 +6,8 @@ import os
 import time
 import tempfile
 import asyncio
-from typing import Dict, Optional, Union, List
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple, Union, List
 from pathlib import Path
 import threading
 from concurrent.futures import ThreadPoolExecutor
@@ -29,6 +30,27 @@ try:
 except ImportError:
     WHISPER_AVAILABLE = False
 
+# faster-whisper STT (CTranslate2: fused kernels, C++ beam search)
+try:
+    from faster_whisper import WhisperModel
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+
+# In-process audio decode (skips Whisper's ffmpeg subprocess)
+try:
+    import numpy as np
+    import soundfile as sf
+    SOUNDFILE_AVAILABLE = True
+except ImportError:
+    SOUNDFILE_AVAILABLE = False
+
+try:
+    import librosa
+    LIBROSA_AVAILABLE = True
+except ImportError:
+    LIBROSA_AVAILABLE = False
+
 settings = get_settings()
 
 
@@ -44,9 +66,12 @@ class OptimizedSpeechEngine:
     
     def __init__(self):
         self.device = "cuda" if TORCH_AVAILABLE and torch.cuda.is_available() else "cpu"
-        self.model_cache = {}
+        self.model_cache: "OrderedDict[str, Any]" = OrderedDict()  # LRU, bounded by SPEECH_MODEL_CACHE_SIZE
         self.whisper_model = None
         self.current_model_size = None
+        self.use_faster_whisper = FASTER_WHISPER_AVAILABLE and (
+            settings.STT_BACKEND == "faster_whisper" or not WHISPER_AVAILABLE
+        )
         
         # Performance settings
         self.default_model_size = "base"  # Much faster than large-v3
@@ -95,8 +120,9 @@ class OptimizedSpeechEngine:
             return True
         
         # Try to load from cache
-        cache_key = f"whisper_{model_size}"
+        cache_key = f"{'faster_whisper' if self.use_faster_whisper else 'whisper'}_{model_size}"
         if cache_key in self.model_cache:
+            self.model_cache.move_to_end(cache_key)
             self.whisper_model = self.model_cache[cache_key]
             self.current_model_size = model_size
             app_logger.info(f"Loaded Whisper {model_size} from cache")
@@ -116,7 +142,7 @@ class OptimizedSpeechEngine:
             
             if self.whisper_model is not None:
                 # Cache the model
-                self.model_cache[cache_key] = self.whisper_model
+                self._cache_model(cache_key, self.whisper_model)
                 self.current_model_size = model_size
                 
                 load_time = time.time() - start_time
@@ -130,6 +156,23 @@ class OptimizedSpeechEngine:
             app_logger.error(f"Whisper model loading failed: {e}")
             return False
     
+    def _cache_model(self, cache_key: str, model: Any) -> None:
+        """
+        Insert into the LRU model cache, evicting the least recently used sizes
+        
+        Quality preferences switch between tiny/base/small; without a bound every
+        size ever requested would stay resident on the GPU.
+        """
+        self.model_cache[cache_key] = model
+        self.model_cache.move_to_end(cache_key)
+        
+        while len(self.model_cache) > settings.SPEECH_MODEL_CACHE_SIZE:
+            evicted_key, evicted = self.model_cache.popitem(last=False)
+            del evicted
+            if self.device == "cuda":
+                torch.cuda.empty_cache()
+            app_logger.info(f"Evicted {evicted_key} from optimized speech model cache")
+    
     def _load_whisper_model_sync(self, model_size: str):
         """Synchronous model loading for thread pool execution"""
         try:
@@ -138,24 +181,68 @@ class OptimizedSpeechEngine:
             os.makedirs(model_dir, exist_ok=True)
             
             # Load model with optimizations
-            model = whisper.load_model(
-                model_size,
-                device=self.device,
-                download_root=model_dir
-            )
+            if self.use_faster_whisper:
+                # INT8 weights on both devices: VNNI/AVX2 int8 GEMMs on CPU, FP16 activations on GPU
+                model = WhisperModel(
+                    model_size,
+                    device=self.device,
+                    compute_type="int8_float16" if self.device == "cuda" else "int8",
+                    download_root=model_dir
+                )
+            else:
+                model = whisper.load_model(
+                    model_size,
+                    device=self.device,
+                    download_root=model_dir
+                )
+                
+                if self.device == "cpu" and settings.STT_INT8:
+                    # fbgemm int8 GEMMs for the Linear layers, as in ProductionSpeechEngine
+                    from app.services.speech_engine import quantize_whisper_int8
+                    model = quantize_whisper_int8(model)
+                # fp16 weights for tensor-core matmuls (Volta+; older GPUs get slower in fp16)
+                elif self.device == "cuda" and torch.cuda.get_device_capability()[0] >= 7:
+                    model = model.half()
             
+            self._warm_up_model(model)
             return model
             
         except Exception as e:
             app_logger.warning(f"Failed to load Whisper {model_size}: {e}")
             return None
     
+    def _warm_up_model(self, model) -> None:
+        """Decode a second of silence so the first request skips cuDNN/allocator cold start"""
+        if settings.STT_WARMUP_PASSES <= 0:
+            return
+        
+        start_time = time.time()
+        silence = torch.zeros(16000, dtype=torch.float32)
+        try:
+            if self.use_faster_whisper:
+                for _ in range(settings.STT_WARMUP_PASSES):
+                    segments, _ = model.transcribe(silence.numpy(), language="en", beam_size=1)
+                    list(segments)
+                return
+            
+            with torch.inference_mode(), torch.autocast(
+                device_type="cuda", dtype=torch.float16, enabled=self.device == "cuda"
+            ):
+                for _ in range(settings.STT_WARMUP_PASSES):
+                    model.transcribe(silence, language="en", fp16=self.device == "cuda", verbose=None)
+        except Exception as e:
+            app_logger.warning(f"Whisper warm-up decode failed: {e}")
+            return
+        
+        app_logger.info(f"Whisper warm-up ({settings.STT_WARMUP_PASSES} passes) took {time.time() - start_time:.2f}s")
+    
     async def speech_to_text_optimized(
         self, 
         audio_path: str, 
         language: Optional[str] = None,
         quality_preference: str = "balanced",
-        with_timestamps: bool = False
+        with_timestamps: bool = False,
+        word_timestamps: bool = False
     ) -> Dict[str, Union[str, float, list]]:
         """
         Optimized speech-to-text with automatic model selection
@@ -164,17 +251,20 @@ class OptimizedSpeechEngine:
             audio_path: Path to audio file
             language: Optional language code
             quality_preference: "fast", "balanced", or "quality"
-            with_timestamps: Whether to include word-level timestamps
+            with_timestamps: Whether to include segment timestamps
+            word_timestamps: Also align individual words (extra cross-attention pass)
         
         Returns:
             Dict with text, language, duration, and optional segments
         """
-        if not WHISPER_AVAILABLE:
+        if not (WHISPER_AVAILABLE or FASTER_WHISPER_AVAILABLE):
             raise ValueError("Whisper not available for STT")
         
         try:
-            # Get audio duration for model selection
-            audio_duration = await self._get_audio_duration(audio_path)
+            # Decode in-process once; the sample count gives the duration for model selection
+            audio, audio_duration = await asyncio.to_thread(self._decode_audio, audio_path)
+            if audio_duration is None:
+                audio_duration = await self._get_audio_duration(audio_path)
             optimal_model_size = self._get_optimal_model_size(audio_duration, quality_preference)
             
             app_logger.info(f"Processing STT: {audio_path} (duration: {audio_duration:.1f}s, model: {optimal_model_size})")
@@ -190,9 +280,9 @@ class OptimizedSpeechEngine:
             result = await loop.run_in_executor(
                 self.executor,
                 self._transcribe_audio_sync,
-                audio_path,
+                audio,
                 language,
-                with_timestamps
+                word_timestamps
             )
             
             processing_time = time.time() - start_time
@@ -223,22 +313,91 @@ class OptimizedSpeechEngine:
             app_logger.error(f"Optimized STT failed: {e}")
             raise ValueError(f"Speech-to-text failed: {str(e)}")
     
-    def _transcribe_audio_sync(self, audio_path: str, language: Optional[str], with_timestamps: bool):
-        """Synchronous transcription for thread pool execution"""
+    def _decode_audio(self, audio_path: str) -> Tuple[Any, Optional[float]]:
+        """
+        Decode to 16kHz mono float32 with soundfile so Whisper does not spawn ffmpeg
+        
+        Returns (samples, duration in seconds). Formats libsndfile cannot read
+        (mp3/m4a/mp4) return (audio_path, None) and are decoded by Whisper itself.
+        """
+        if not SOUNDFILE_AVAILABLE:
+            return audio_path, None
+        
+        try:
+            audio, sr = sf.read(audio_path, dtype="float32", always_2d=False)
+        except RuntimeError:
+            return audio_path, None
+        
+        if audio.ndim > 1:
+            audio = audio.mean(axis=1, dtype=np.float32)
+        if sr != 16000:
+            if not LIBROSA_AVAILABLE:
+                return audio_path, len(audio) / sr
+            audio = librosa.resample(audio, orig_sr=sr, target_sr=16000)
+        
+        return audio, len(audio) / 16000
+    
+    def _transcribe_audio_sync(self, audio: Union[str, Any], language: Optional[str], word_timestamps: bool):
+        """Synchronous transcription for thread pool execution (audio is a path or 16kHz samples)"""
+        if self.use_faster_whisper:
+            return self._transcribe_faster_whisper(audio, language, word_timestamps)
+        
         options = {
             "language": language,
-            "verbose": False
+            "verbose": False,
+            "fp16": self.device == "cuda"
         }
         
-        if with_timestamps:
+        if word_timestamps:
             options["word_timestamps"] = True
         
-        return self.whisper_model.transcribe(audio_path, **options)
+        # Runs on an executor thread, where grad mode is not inherited from the caller
+        with torch.inference_mode(), torch.autocast(
+            device_type="cuda", dtype=torch.float16, enabled=self.device == "cuda"
+        ):
+            return self.whisper_model.transcribe(audio, **options)
+    
+    def _transcribe_faster_whisper(self, audio: Union[str, Any], language: Optional[str], word_timestamps: bool):
+        """faster-whisper transcription mapped to openai-whisper's {"text", "language", "segments"} result"""
+        segments, info = self.whisper_model.transcribe(
+            audio,
+            language=language,
+            beam_size=settings.STT_BEAM_SIZE,
+            vad_filter=settings.STT_VAD,
+            word_timestamps=word_timestamps
+        )
+        
+        # segments is a generator: decoding happens as it is consumed
+        result_segments = [
+            {
+                "start": segment.start,
+                "end": segment.end,
+                "text": segment.text,
+                "words": [
+                    {"word": word.word, "start": word.start, "end": word.end, "probability": word.probability}
+                    for word in (segment.words or [])
+                ]
+            }
+            for segment in segments
+        ]
+        
+        return {
+            "text": "".join(segment["text"] for segment in result_segments),
+            "language": info.language,
+            "segments": result_segments
+        }
     
     async def _get_audio_duration(self, audio_path: str) -> float:
         """Get audio duration without loading full audio"""
+        if SOUNDFILE_AVAILABLE:
+            try:
+                # Header-only read: no decode and no subprocess
+                return sf.info(audio_path).duration
+            except RuntimeError:
+                pass
+        
         try:
-            # Use ffprobe for fast duration detection
+            # Use ffprobe for formats libsndfile cannot open
             import subprocess
             result = subprocess.run([
                 'ffprobe', '-v', 'quiet', '-show_entries', 'format=duration',
@@ -260,16 +419,21 @@ class OptimizedSpeechEngine:
         self, 
         audio_path: str, 
         language: Optional[str] = None,
-        quality_preference: str = "balanced"
+        quality_preference: str = "balanced",
+        word_timestamps: bool = False
     ) -> Dict[str, Union[str, float, list]]:
         """
         Optimized STT with timestamps using automatic model selection
+        
+        Segment timestamps are enough for subtitles; pass word_timestamps=True
+        only when per-word timing is needed.
         """
         return await self.speech_to_text_optimized(
             audio_path=audio_path,
             language=language,
             quality_preference=quality_preference,
-            with_timestamps=True
+            with_timestamps=True,
+            word_timestamps=word_timestamps
         )
     
     def cleanup(self):
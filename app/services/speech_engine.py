@@ -6,12 +6,27 @@ import os
 import time
 import tempfile
 import asyncio
-from typing import Dict, Optional, Union, List
+import contextlib
+import hashlib
+import io
+import shutil
+import subprocess
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from operator import itemgetter
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple, Union, List
 from pathlib import Path
+from types import MappingProxyType
+
+import numpy as np
+import psutil
 
 # Core dependencies
 from app.core.config import get_settings, SUPPORTED_LANGUAGES
 from app.utils.logger import app_logger
+from app.utils.micro_batcher import MicroBatcher
 
 # Audio processing
 try:
@@ -29,7 +44,48 @@ try:
     app_logger.info("Whisper STT available")
 except ImportError:
     WHISPER_AVAILABLE = False
-    app_logger.warning("Whisper not available - STT disabled")
+    app_logger.warning("openai-whisper not available")
+
+# faster-whisper STT (CTranslate2 INT8 kernels)
+try:
+    from faster_whisper import WhisperModel
+    FASTER_WHISPER_AVAILABLE = True
+    app_logger.info("faster-whisper STT available")
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+    app_logger.warning("faster-whisper not available")
+
+# faster-whisper >= 1.1: VAD-chunked audio decoded STT_BATCH_SIZE chunks at a time
+try:
+    from faster_whisper import BatchedInferencePipeline
+    FW_BATCHED_AVAILABLE = True
+except ImportError:
+    FW_BATCHED_AVAILABLE = False
+
+# Transformers Whisper for batched long-form STT
+try:
+    from transformers import AutoModelForSpeechSeq2Seq, AutoProcessor, pipeline as hf_pipeline
+    HF_ASR_AVAILABLE = TORCH_AVAILABLE
+except ImportError:
+    HF_ASR_AVAILABLE = False
+
+# Whisper models consume 16kHz mono audio
+WHISPER_SAMPLE_RATE = 16000
+
+# Decoder for formats libsndfile cannot read
+FFMPEG_PATH = shutil.which("ffmpeg")
+
+# Buffered audio decode: read-ahead buffer and frames per decoded block
+AUDIO_READ_BUFFER_BYTES = 4 * 1024 * 1024
+AUDIO_BLOCK_FRAMES = 1 << 15
+
+# Multilingual Whisper checkpoints tried in order. Distil-Whisper checkpoints are
+# English-only, so they are never picked implicitly for the 22 Indic languages.
+WHISPER_FALLBACK_MODELS = ["large-v3", "medium"]
+
+STT_AVAILABLE = WHISPER_AVAILABLE or FASTER_WHISPER_AVAILABLE or HF_ASR_AVAILABLE
+if not STT_AVAILABLE:
+    app_logger.warning("No Whisper backend available - STT disabled")
 
 # TTS engines - VITS/Tacotron2 + HiFi-GAN as specified
 try:
@@ -40,6 +96,14 @@ except ImportError:
     TTS_AVAILABLE = False
     app_logger.warning("TTS library not available")
 
+# Local Piper voices (VITS exported to ONNX Runtime), preferred over gTTS's network round-trip
+try:
+    from piper import PiperVoice
+    import wave
+    PIPER_AVAILABLE = True
+except ImportError:
+    PIPER_AVAILABLE = False
+
 # Fallback gTTS
 try:
     from gtts import gTTS
@@ -50,16 +114,105 @@ except ImportError:
     app_logger.warning("gTTS not available")
 
 # Optional audio validation
+try:
+    import soundfile as sf
+    SOUNDFILE_AVAILABLE = True
+except ImportError:
+    SOUNDFILE_AVAILABLE = False
+
 try:
     import librosa
-    import numpy as np
     LIBROSA_AVAILABLE = True
 except ImportError:
     LIBROSA_AVAILABLE = False
-    app_logger.info("librosa not available - using basic audio validation")
+    if not SOUNDFILE_AVAILABLE:
+        app_logger.info("librosa not available - using basic audio validation")
+
+# Audio content hashing for the transcript cache
+try:
+    from blake3 import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
 
 settings = get_settings()
 
+# Content-addressed gTTS MP3 cache (see _save_gtts)
+GTTS_CACHE_DIR = Path(tempfile.gettempdir()) / "tts_cache"
+
+# Physical cores for faster-whisper's CTranslate2 pool (scoped to the STT model):
+# SMT siblings share the FPU/caches, so pools sized to logical cores contend with
+# themselves. torch's process-wide intra-op pool is left to the entrypoint.
+PHYSICAL_CORES = psutil.cpu_count(logical=False) or max(1, (os.cpu_count() or 2) // 2)
+
+# Language codes understood by the multilingual TTS model and gTTS (others fall back to English)
+_TTS_LANG_MAP = MappingProxyType({
+    "hi": "hi", "bn": "bn", "ta": "ta", "te": "te", "mr": "mr",
+    "gu": "gu", "kn": "kn", "ml": "ml", "pa": "pa", "ur": "ur",
+    "en": "en"
+})
+
+# Language codes accepted for STT and TTS (SUPPORTED_LANGUAGES includes "en")
+_SUPPORTED_CODES = frozenset(SUPPORTED_LANGUAGES)
+
+# (start, end, text) of a _transcribe segment; every backend's segments carry all three
+_segment_fields = itemgetter("start", "end", "text")
+
+# Files above this size are hashed by head + tail + size instead of in full
+STT_CACHE_FULL_HASH_BYTES = 8 * 1024 * 1024
+STT_CACHE_EDGE_BYTES = 1024 * 1024
+
+
+def _hash_audio_file(audio_path: str) -> str:
+    """Content hash of an audio file (blake3, else blake2b); large files hash first/last 1MB + size"""
+    hasher = blake3() if BLAKE3_AVAILABLE else hashlib.blake2b()
+    size = os.path.getsize(audio_path)
+    
+    with open(audio_path, "rb") as f:
+        if size <= STT_CACHE_FULL_HASH_BYTES:
+            hasher.update(f.read())
+        else:
+            hasher.update(f.read(STT_CACHE_EDGE_BYTES))
+            f.seek(-STT_CACHE_EDGE_BYTES, os.SEEK_END)
+            hasher.update(f.read(STT_CACHE_EDGE_BYTES))
+            hasher.update(str(size).encode())
+    
+    return hasher.hexdigest()
+
+
+def quantize_whisper_int8(model: Any) -> Any:
+    """
+    Dynamic INT8 quantization of an openai-whisper model's Linear layers (CPU)
+    
+    openai-whisper builds its layers from whisper.model.Linear, a subclass that
+    quantize_dynamic's exact-type matching skips and that the dynamic Linear's
+    from_float rejects. Each one is therefore rebuilt as a plain nn.Linear over
+    the same parameters first; the fp32 CPU path never needs its dtype cast.
+    The swapped modules are counted so a silent no-op shows up in the log.
+    """
+    for parent in list(model.modules()):
+        for name, child in list(parent.named_children()):
+            if isinstance(child, whisper.model.Linear):
+                plain = torch.nn.Linear(child.in_features, child.out_features, bias=child.bias is not None)
+                plain.weight = child.weight
+                plain.bias = child.bias
+                setattr(parent, name, plain)
+    
+    model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    swapped = sum(isinstance(m, torch.ao.nn.quantized.dynamic.Linear) for m in model.modules())
+    if swapped:
+        app_logger.info(f"Whisper INT8: {swapped} Linear layers dynamically quantized")
+    else:
+        app_logger.warning("Whisper INT8: no Linear layers were quantized; running fp32")
+    return model
+
+
+# Evict cached speech models while allocated VRAM is above this fraction
+SPEECH_VRAM_EVICT_FRACTION = 0.85
+
+# Scratch TTS outputs are copied or streamed and then deleted, so keep them off disk
+EPHEMERAL_AUDIO_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+
 
 class ProductionSpeechEngine:
     """
@@ -69,11 +222,45 @@ class ProductionSpeechEngine:
     
     def __init__(self):
         self.device = "cuda" if TORCH_AVAILABLE and torch.cuda.is_available() else "cpu"
+        
+        # Created once here instead of on every TTS request
+        os.makedirs(settings.OUTPUT_DIR, exist_ok=True)
+        
+        self.amp_dtype = self._resolve_amp_dtype()
         self.whisper_model = None
+        self.stt_backend = None  # "faster_whisper", "hf_batched" or "openai" once a model is loaded
         self.tts_model = None
         self.tts_model_name = None
         self.tts_is_multilingual = False
-        self.model_cache = {}
+        self._tts_load_lock = threading.Lock()
+        # Coqui's TTS object is not safe to drive from several threads at once
+        self._tts_synth_lock = threading.Lock()
+        self._stt_load_lock = threading.Lock()  # one Whisper load at a time (warm-up vs requests)
+        self._fw_batched = None  # BatchedInferencePipeline over the current faster-whisper model
+        self._piper_voices: Dict[str, Any] = {}  # language -> loaded PiperVoice
+        self.model_cache: "OrderedDict[str, Any]" = OrderedDict()  # LRU, bounded by SPEECH_MODEL_CACHE_SIZE
+        
+        # LRU of finished transcripts: (audio hash, language hint) -> speech_to_text result
+        self._stt_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        
+        # Dedicated STT pool so concurrent requests overlap on the GPU; each worker
+        # thread lazily gets its own CUDA stream (see _cuda_stream)
+        self._stt_executor = ThreadPoolExecutor(
+            max_workers=settings.STT_CONCURRENCY, thread_name_prefix="stt"
+        )
+        self._stream_local = threading.local()
+        # openai-whisper installs kv-cache hooks on the shared model per decode,
+        # so concurrent decodes would corrupt each other's caches
+        self._openai_decode_lock = threading.Lock()
+        
+        # Cross-request micro-batcher for the hf_batched pipeline (keyed by language hint)
+        self._stt_batcher = MicroBatcher(
+            self._transcribe_batch,
+            max_batch_size=settings.STT_MAX_REQUEST_BATCH,
+            max_wait_ms=settings.STT_MICRO_BATCH_WAIT_MS,
+            name="stt-batcher"
+        )
+
         self.supported_formats = ['.wav', '.mp3', '.mp4', '.m4a', '.flac', '.ogg']
         
         # Performance tracking
@@ -86,13 +273,18 @@ class ProductionSpeechEngine:
         """
         Load Whisper model with optimized configuration
         
+        Thread-safe: the startup warm-up loads in a worker thread while requests
+        may call this concurrently, so only one load runs and the others wait on
+        _stt_load_lock. The model is published only once stt_backend matches it.
+        
         Args:
-            model_size: Model size (base, small, medium, large, large-v2, large-v3)
+            model_size: Model size (base, small, medium, large-v3, ...). distil-* names
+                are English-only and only make sense for English-only deployments.
         
         Returns:
             bool: True if loaded successfully
         """
-        if not WHISPER_AVAILABLE:
+        if not STT_AVAILABLE:
             app_logger.error("Whisper not available - cannot load STT model")
             return False
         
@@ -101,11 +293,22 @@ class ProductionSpeechEngine:
             app_logger.debug("Whisper model already loaded")
             return True
         
+        with self._stt_load_lock:
+            if self.whisper_model is not None:
+                return True
+            return self._load_whisper_model_locked(model_size)
+    
+    def _load_whisper_model_locked(self, model_size: str) -> bool:
+        """Body of load_whisper_model; the caller holds _stt_load_lock"""
+        backend = self._select_stt_backend()
+        
         # Try to load from cache
-        cache_key = f"whisper_{model_size}"
+        cache_key = f"{backend}_{model_size}"
         if cache_key in self.model_cache:
+            self.model_cache.move_to_end(cache_key)
+            self.stt_backend = backend
             self.whisper_model = self.model_cache[cache_key]
-            app_logger.info(f"Loaded Whisper {model_size} from cache")
+            app_logger.info(f"Loaded Whisper {model_size} ({backend}) from cache")
             return True
         
         try:
@@ -113,7 +316,13 @@ class ProductionSpeechEngine:
             app_logger.info(f"Loading Whisper model: {model_size}")
             
             # Fallback model sizes in order of preference
-            models_to_try = ["base", "tiny", "small", model_size] if model_size not in ["base", "tiny", "small"] else [model_size]
+            models_to_try = [model_size] + [name for name in WHISPER_FALLBACK_MODELS if name != model_size]
+            if backend == "hf_batched":
+                # The batched pipeline loads HuggingFace checkpoints, starting with the configured one
+                models_to_try = [settings.WHISPER_MODEL] + [
+                    f"distil-whisper/{name}" if name.startswith("distil-") else f"openai/whisper-{name}"
+                    for name in models_to_try
+                ]
             
             for model_name in models_to_try:
                 try:
@@ -122,18 +331,48 @@ class ProductionSpeechEngine:
                     os.makedirs(model_dir, exist_ok=True)
                     
                     # Load model with optimizations
-                    self.whisper_model = whisper.load_model(
-                        model_name,
-                        device=self.device,
-                        download_root=model_dir
-                    )
+                    if backend == "hf_batched":
+                        model = self._load_hf_whisper_pipeline(model_name)
+                    elif backend == "faster_whisper":
+                        # CTranslate2 fused INT8 GEMMs (FP16 activations on GPU)
+                        model = WhisperModel(
+                            model_name,
+                            device=self.device,
+                            compute_type="int8_float16" if self.device == "cuda" else "int8",
+                            download_root=model_dir,
+                            cpu_threads=PHYSICAL_CORES,
+                            # One CPU replica (a second would split the cores); on CUDA two
+                            # workers let concurrent requests from the STT pool decode in parallel
+                            num_workers=2 if self.device == "cuda" else 1
+                        )
+                    else:
+                        model = whisper.load_model(
+                            model_name,
+                            device=self.device,
+                            download_root=model_dir
+                        )
+                        if self.device == "cpu" and settings.STT_INT8:
+                            # fbgemm int8 GEMMs for the attention and MLP projections
+                            model = quantize_whisper_int8(model)
+                        elif self.device == "cuda" and torch.cuda.get_device_capability()[0] >= 7:
+                            # Store fp16 weights: whisper casts fp32 weights to the fp16 activations
+                            # on every forward otherwise. Pre-Volta GPUs have no fp16 tensor cores.
+                            model = model.half()
+                        if self.device == "cuda" and settings.STT_TORCH_COMPILE:
+                            self._compile_whisper_encoder(model)
+                    
+                    # Publish the backend before the model: readers check whisper_model
+                    # and then dispatch on stt_backend
+                    self.stt_backend = backend
+                    self.whisper_model = model
                     
                     # Cache the model
-                    self.model_cache[cache_key] = self.whisper_model
+                    self._cache_model(cache_key, model)
                     
                     load_time = time.time() - start_time
-                    app_logger.info(f"Whisper {model_name} loaded in {load_time:.2f}s")
+                    app_logger.info(f"Whisper {model_name} ({backend}) loaded in {load_time:.2f}s")
                     
+                    self._warm_up_whisper()
                     return True
                     
                 except Exception as e:
@@ -147,12 +386,377 @@ class ProductionSpeechEngine:
             app_logger.error(f"Whisper model loading failed: {e}")
             return False
     
-    def validate_audio_file(self, audio_path: str) -> Dict[str, any]:
+    def _warm_up_whisper(self) -> None:
+        """
+        Decode a second of silence STT_WARMUP_PASSES times after a load
+        
+        The first real request would otherwise pay for cuDNN algorithm selection,
+        CUDA allocator growth and lazy kernel initialization.
+        """
+        if settings.STT_WARMUP_PASSES <= 0:
+            return
+        
+        start_time = time.time()
+        silence = np.zeros(WHISPER_SAMPLE_RATE, dtype=np.float32)
+        try:
+            for _ in range(settings.STT_WARMUP_PASSES):
+                self._transcribe(silence, "en")
+        except Exception as e:
+            app_logger.warning(f"Whisper warm-up decode failed: {e}")
+            return
+        
+        app_logger.info(f"Whisper warm-up ({settings.STT_WARMUP_PASSES} passes) took {time.time() - start_time:.2f}s")
+    
+    def _compile_whisper_encoder(self, model: Any) -> None:
+        """
+        Replace the openai-whisper encoder with an Inductor-compiled version
+        
+        The encoder always sees a fixed (1, n_mels, 3000) window, so it compiles
+        once into fused, autotuned kernels. CUDA graphs are left out on purpose:
+        cudagraph trees are per-thread, and decodes run on the STT pool threads
+        rather than the loader thread, so every worker would record its own
+        graphs. The decoder is left eager: its input length grows every token
+        and its kv-cache hooks would force constant recompiles. Compilation and
+        autotuning happen on the first forward, i.e. during _warm_up_whisper.
+        """
+        if not hasattr(torch, "compile"):
+            return
+        
+        try:
+            model.encoder = torch.compile(
+                model.encoder, mode="max-autotune-no-cudagraphs", fullgraph=False
+            )
+            app_logger.info("Whisper encoder compiled with torch.compile (max-autotune-no-cudagraphs)")
+        except Exception as e:
+            app_logger.warning(f"torch.compile unavailable for the Whisper encoder: {e}")
+    
+    def _cache_model(self, cache_key: str, model: Any) -> None:
+        """
+        Insert into the LRU model cache, evicting the oldest entries
+        
+        Entries are evicted beyond SPEECH_MODEL_CACHE_SIZE, and also while VRAM use
+        is above SPEECH_VRAM_EVICT_FRACTION of the device, so switching sizes
+        does not leave every model resident on the GPU.
+        """
+        self.model_cache[cache_key] = model
+        self.model_cache.move_to_end(cache_key)
+        
+        while len(self.model_cache) > 1 and (
+            len(self.model_cache) > settings.SPEECH_MODEL_CACHE_SIZE or self._vram_over_threshold()
+        ):
+            evicted_key, evicted = self.model_cache.popitem(last=False)
+            del evicted
+            if self.device == "cuda":
+                torch.cuda.empty_cache()
+            app_logger.info(f"Evicted {evicted_key} from speech model cache")
+    
+    def _vram_over_threshold(self) -> bool:
+        """True when allocated CUDA memory exceeds SPEECH_VRAM_EVICT_FRACTION of the device"""
+        if self.device != "cuda":
+            return False
+        total = torch.cuda.get_device_properties(0).total_memory
+        return torch.cuda.memory_allocated() > SPEECH_VRAM_EVICT_FRACTION * total
+    
+    def _select_stt_backend(self) -> str:
+        """STT backend to load: the configured one if installed, otherwise whichever is available"""
+        if settings.STT_BACKEND == "faster_whisper" and FASTER_WHISPER_AVAILABLE:
+            return "faster_whisper"
+        if settings.STT_BACKEND == "hf_batched" and HF_ASR_AVAILABLE:
+            return "hf_batched"
+        if WHISPER_AVAILABLE:
+            if settings.STT_BACKEND != "openai":
+                app_logger.warning(f"STT_BACKEND={settings.STT_BACKEND} is not installed, using openai-whisper")
+            return "openai"
+        return "faster_whisper" if FASTER_WHISPER_AVAILABLE else "hf_batched"
+    
+    def _load_hf_whisper_pipeline(self, model_id: str):
+        """
+        Build a transformers ASR pipeline for chunked, batched long-form transcription
+        
+        Long audio is cut into STT_CHUNK_LENGTH_S windows and STT_BATCH_SIZE of them
+        go through the encoder together, instead of one 30s window at a time.
+        """
+        dtype = self.amp_dtype
+        model = self._load_hf_whisper_model(model_id, dtype)
+        model.to(self.device)
+        model.eval()
+        
+        processor = AutoProcessor.from_pretrained(model_id)
+        return hf_pipeline(
+            "automatic-speech-recognition",
+            model=model,
+            tokenizer=processor.tokenizer,
+            feature_extractor=processor.feature_extractor,
+            torch_dtype=dtype,
+            device=self.device
+        )
+    
+    def _whisper_attn_implementation(self) -> str:
+        """
+        Attention kernel for the Whisper encoder, chosen by GPU compute capability
+        
+        The encoder attends over 1500 mel frames per window; Flash-Attention 2 fuses
+        softmax and matmul so that attention matrix never lands in HBM. FA2 needs
+        Ampere (SM 8.0) or newer and the flash-attn package; pre-Ampere GPUs get
+        BetterTransformer, everything else SDPA.
+        """
+        if self.device != "cuda":
+            return "sdpa"
+        
+        major, _ = torch.cuda.get_device_capability()
+        if major >= 8:
+            try:
+                import flash_attn  # noqa: F401
+                return "flash_attention_2"
+            except ImportError:
+                return "sdpa"
+        return "bettertransformer"
+    
+    def _load_hf_whisper_model(self, model_id: str, dtype):
+        """Load the HF Whisper model with the fastest attention kernel this GPU supports"""
+        attn_implementation = self._whisper_attn_implementation()
+        load_kwargs = {"torch_dtype": dtype, "low_cpu_mem_usage": True}
+        
+        if attn_implementation == "bettertransformer":
+            model = AutoModelForSpeechSeq2Seq.from_pretrained(model_id, **load_kwargs)
+            try:
+                model = model.to_bettertransformer()
+                app_logger.info("Whisper encoder using BetterTransformer")
+            except Exception as e:
+                app_logger.warning(f"BetterTransformer unavailable for Whisper: {e}")
+            return model
+        
+        try:
+            model = AutoModelForSpeechSeq2Seq.from_pretrained(
+                model_id, attn_implementation=attn_implementation, **load_kwargs
+            )
+            app_logger.info(f"Whisper encoder using {attn_implementation} attention")
+            return model
+        except (ValueError, ImportError) as e:
+            app_logger.warning(f"{attn_implementation} attention unavailable for Whisper: {e}, using sdpa")
+        
+        return AutoModelForSpeechSeq2Seq.from_pretrained(model_id, attn_implementation="sdpa", **load_kwargs)
+    
+    def _transcribe(
+        self,
+        audio: Any,
+        language: Optional[str] = None,
+        word_timestamps: bool = False,
+        **whisper_options
+    ) -> Dict[str, Any]:
+        """
+        Run the loaded STT backend and return an openai-whisper style result
+        
+        faster-whisper results are mapped to {"text", "language", "segments"} with
+        per-segment start/end/text/avg_logprob/words so callers are backend-agnostic.
+        The hf_batched pipeline returns segment-level chunks (no word timings) and
+        does not report the detected language. whisper_options only apply to the
+        openai-whisper backend.
+        """
+        if self.stt_backend == "hf_batched":
+            return self._transcribe_hf([audio], language)[0]
+        
+        if self.stt_backend != "faster_whisper":
+            with self._openai_decode_lock, self._cuda_stream(), self._torch_inference():
+                return self.whisper_model.transcribe(
+                    audio, language=language, word_timestamps=word_timestamps, **whisper_options
+                )
+        
+        if FW_BATCHED_AVAILABLE and settings.STT_BATCH_SIZE > 1:
+            # Whole-file results do not need segments in order as they decode, so
+            # the VAD chunks go through the model STT_BATCH_SIZE at a time
+            segments, info = self._batched_whisper().transcribe(
+                audio,
+                language=language,
+                batch_size=settings.STT_BATCH_SIZE,
+                beam_size=settings.STT_BEAM_SIZE,
+                vad_filter=settings.STT_VAD,
+                without_timestamps=False,
+                word_timestamps=word_timestamps
+            )
+            result_segments = list(self._map_fw_segments(segments))
+            detected_language = info.language
+        else:
+            segments, detected_language = self._transcribe_lazy(audio, language, word_timestamps)
+            result_segments = list(segments)
+        
+        return {
+            "text": "".join(segment["text"] for segment in result_segments),
+            "language": detected_language,
+            "segments": result_segments
+        }
+    
+    def _transcribe_hf(self, audios: List[Any], language: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Run the hf_batched pipeline over one or more inputs in a single call
+        
+        The pipeline chunks every input and feeds the chunks of all of them to
+        the encoder STT_BATCH_SIZE at a time, so clips from concurrent requests
+        share encoder forwards instead of each running at batch 1.
+        """
+        # return_timestamps is required for chunked long-form decoding: chunk
+        # outputs are stitched back together by timestamp
+        generate_kwargs = {"task": "transcribe", "num_beams": settings.STT_BEAM_SIZE}
+        if language:
+            generate_kwargs["language"] = language
+        
+        with self._cuda_stream(), self._torch_inference(self.amp_dtype):
+            outputs = self.whisper_model(
+                audios,
+                chunk_length_s=settings.STT_CHUNK_LENGTH_S,
+                batch_size=settings.STT_BATCH_SIZE,
+                return_timestamps=True,
+                generate_kwargs=generate_kwargs
+            )
+        
+        results = []
+        for output in outputs:
+            result_segments = []
+            for chunk in output.get("chunks", []):
+                start, end = chunk.get("timestamp") or (0.0, None)
+                start = start or 0.0
+                result_segments.append({
+                    "start": start,
+                    "end": end if end is not None else start,
+                    "text": chunk.get("text", ""),
+                    "words": []
+                })
+            
+            results.append({
+                "text": output.get("text", ""),
+                "language": language or "unknown",
+                "segments": result_segments
+            })
+        return results
+    
+    async def _transcribe_batch(self, language: Optional[str], audios: List[Any]) -> List[Dict[str, Any]]:
+        """MicroBatcher handler: transcribe every queued clip for one language hint in one pipeline call"""
+        return await self._run_stt(self._transcribe_hf, audios, language)
+    
+    def _cuda_stream(self):
+        """
+        Run the enclosed kernels on this thread's own CUDA stream
+        
+        Whisper at batch 1 leaves most of the GPU idle; separate streams let
+        kernels from concurrent requests execute side by side instead of
+        queueing on the default stream. faster-whisper schedules its own CUDA
+        work in CTranslate2 and does not use this.
+        """
+        if self.device != "cuda":
+            return contextlib.nullcontext()
+        
+        stream = getattr(self._stream_local, "stream", None)
+        if stream is None:
+            stream = self._stream_local.stream = torch.cuda.Stream()
+        return torch.cuda.stream(stream)
+    
+    async def _run_stt(self, func, *args, **kwargs):
+        """Run blocking STT work on the dedicated STT thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._stt_executor, partial(func, *args, **kwargs))
+    
+    def _torch_inference(self, amp_dtype=None):
+        """
+        inference_mode plus autocast on CUDA for the torch Whisper backends
+        
+        amp_dtype defaults to fp16, which openai-whisper's decode loop is built
+        around. Grad mode is thread-local and transcription runs in worker
+        threads, so this is entered inside _transcribe rather than by the async callers.
+        """
+        if not TORCH_AVAILABLE:
+            return contextlib.nullcontext()
+        
+        amp_dtype = amp_dtype or torch.float16
+        stack = contextlib.ExitStack()
+        stack.enter_context(torch.inference_mode())
+        stack.enter_context(
+            torch.autocast(
+                device_type="cuda",
+                dtype=amp_dtype,
+                enabled=self.device == "cuda" and amp_dtype != torch.float32
+            )
+        )
+        return stack
+    
+    def _resolve_amp_dtype(self):
+        """
+        Half-precision dtype for the transformers Whisper pipeline
+        
+        Ampere+ (SM 8.0) gets bf16: the same tensor-core throughput as fp16 with
+        fp32's exponent range, so no overflow in attention logits. Volta/Turing get
+        fp16; older GPUs and CPUs stay fp32, where fp16 is slower.
+        """
+        if not TORCH_AVAILABLE or self.device != "cuda":
+            return torch.float32 if TORCH_AVAILABLE else None
+        
+        major, _ = torch.cuda.get_device_capability(0)
+        if major >= 8:
+            return torch.bfloat16
+        if major >= 7:
+            return torch.float16
+        return torch.float32
+    
+    def _transcribe_lazy(
+        self,
+        audio: Any,
+        language: Optional[str] = None,
+        word_timestamps: bool = False,
+        **whisper_options
+    ) -> Tuple[Iterator[Dict[str, Any]], str]:
+        """
+        Start transcription and return (segment iterator, detected language)
+        
+        With faster-whisper only language detection runs up front; each segment is
+        decoded as the iterator is consumed. Other backends transcribe everything
+        here and iterate over the finished segments.
+        """
+        if self.stt_backend != "faster_whisper":
+            result = self._transcribe(audio, language, word_timestamps, **whisper_options)
+            return iter(result.get("segments", [])), result.get("language", "unknown")
+        
+        segments, info = self.whisper_model.transcribe(
+            audio,
+            language=language,
+            beam_size=settings.STT_BEAM_SIZE,
+            best_of=settings.STT_BEAM_SIZE,
+            vad_filter=settings.STT_VAD,
+            vad_parameters=dict(min_silence_duration_ms=500),
+            condition_on_previous_text=False,
+            word_timestamps=word_timestamps
+        )
+        
+        # segments is a generator: decoding happens as it is consumed
+        return self._map_fw_segments(segments), info.language
+    
+    def _map_fw_segments(self, segments: Iterator[Any]) -> Iterator[Dict[str, Any]]:
+        """Lazily map faster-whisper Segment objects to openai-whisper style dicts"""
+        return (
+            {
+                "start": segment.start,
+                "end": segment.end,
+                "text": segment.text,
+                "avg_logprob": segment.avg_logprob,
+                "words": [
+                    {"word": word.word, "start": word.start, "end": word.end, "probability": word.probability}
+                    for word in (segment.words or [])
+                ]
+            }
+            for segment in segments
+        )
+    
+    def _batched_whisper(self) -> Any:
+        """BatchedInferencePipeline wrapping the loaded faster-whisper model (rebuilt when the model changes)"""
+        if self._fw_batched is None or self._fw_batched.model is not self.whisper_model:
+            self._fw_batched = BatchedInferencePipeline(model=self.whisper_model)
+        return self._fw_batched
+    
+    def validate_audio_file(self, audio_path: str, audio: Optional["np.ndarray"] = None) -> Dict[str, any]:
         """
         Validate audio file with comprehensive checks
         
         Args:
             audio_path: Path to audio file
+            audio: Already decoded 16kHz mono samples; when given, the file is not re-read
             
         Returns:
             Dict with validation results
@@ -177,29 +781,18 @@ class ProductionSpeechEngine:
                     "error": f"Unsupported format. Supported: {', '.join(self.supported_formats)}"
                 }
             
-            # Advanced validation with librosa
-            if LIBROSA_AVAILABLE:
+            # Advanced validation with soundfile / librosa
+            if audio is not None or SOUNDFILE_AVAILABLE or LIBROSA_AVAILABLE:
                 try:
-                    # Load first 10 seconds for validation
-                    audio, sr = librosa.load(audio_path, sr=None, duration=10)
-                    
-                    # Check for silence
-                    rms_energy = np.sqrt(np.mean(audio**2))
-                    is_silent = rms_energy < 0.001
-                    
-                    # Check sample rate
-                    is_good_sr = sr >= 8000
-                    
-                    # Check duration
-                    duration = len(audio) / sr
+                    if audio is not None:
+                        sr = WHISPER_SAMPLE_RATE
+                    else:
+                        # Load first 10 seconds for validation
+                        audio, sr = self._read_audio_head(audio_path, seconds=10)
                     
                     return {
-                        "is_valid": not is_silent and is_good_sr and duration > 0.1,
+                        **self._validate_audio_array(audio, sr),
                         "file_size_mb": file_size / (1024 * 1024),
-                        "duration_seconds": duration,
-                        "sample_rate": sr,
-                        "rms_energy": float(rms_energy),
-                        "is_silent": is_silent,
                         "format": file_ext
                     }
                     
@@ -225,6 +818,107 @@ class ProductionSpeechEngine:
             app_logger.error(f"Audio validation failed: {e}")
             return {"is_valid": False, "error": str(e)}
     
+    def _validate_audio_array(self, audio: "np.ndarray", sr: int) -> Dict[str, any]:
+        """Silence, sample-rate and duration checks on decoded mono samples"""
+        # Check for silence
+        rms_energy = np.sqrt(np.mean(audio * audio, dtype=np.float64)) if len(audio) else 0.0
+        is_silent = rms_energy < 0.001
+        
+        # Check sample rate
+        is_good_sr = sr >= 8000
+        
+        # Check duration
+        duration = len(audio) / sr
+        
+        return {
+            "is_valid": not is_silent and is_good_sr and duration > 0.1,
+            "duration_seconds": duration,
+            "sample_rate": sr,
+            "rms_energy": float(rms_energy),
+            "is_silent": is_silent
+        }
+    
+    def _load_audio_16k(self, audio_path: str) -> Optional["np.ndarray"]:
+        """
+        Decode the whole file once into 16kHz mono float32, the input every STT backend accepts
+        
+        soundfile + librosa.resample (soxr) avoids an ffmpeg subprocess; other
+        formats (mp3/m4a/mp4) take exactly one ffmpeg launch, or librosa when
+        ffmpeg is missing. Returns None when no decoder is installed so callers
+        can pass the path instead.
+        """
+        if SOUNDFILE_AVAILABLE:
+            try:
+                audio, sr = self._read_audio_buffered(audio_path)
+                if sr == WHISPER_SAMPLE_RATE:
+                    return audio
+                if LIBROSA_AVAILABLE:
+                    return librosa.resample(audio, orig_sr=sr, target_sr=WHISPER_SAMPLE_RATE)
+            except RuntimeError:
+                pass
+        
+        if FFMPEG_PATH:
+            return self._decode_with_ffmpeg(audio_path)
+        if LIBROSA_AVAILABLE:
+            return librosa.load(audio_path, sr=WHISPER_SAMPLE_RATE)[0]
+        return None
+    
+    def _decode_with_ffmpeg(self, audio_path: str) -> "np.ndarray":
+        """One ffmpeg run: any container/codec -> 16kHz mono s16le on a pipe -> float32 samples"""
+        cmd = [
+            FFMPEG_PATH, "-nostdin", "-threads", "1",
+            "-i", audio_path,
+            "-f", "s16le", "-ac", "1", "-ar", str(WHISPER_SAMPLE_RATE),
+            "-loglevel", "error",
+            "-"
+        ]
+        result = subprocess.run(cmd, capture_output=True, check=True, timeout=300)
+        return np.frombuffer(result.stdout, dtype=np.int16).astype(np.float32) / 32768.0
+    
+    def _read_audio_buffered(self, audio_path: str):
+        """
+        Read a whole file as mono float32 through a 4MB userspace buffer
+        
+        Codecs issue many small reads and seeks; the large buffer turns them into
+        a few big syscalls. Blocks are downmixed straight into one preallocated
+        array rather than appended to a list and concatenated.
+        """
+        with open(audio_path, "rb", buffering=AUDIO_READ_BUFFER_BYTES) as raw, sf.SoundFile(raw) as f:
+            sr = f.samplerate
+            audio = np.empty(f.frames, dtype=np.float32)
+            
+            pos = 0
+            for block in f.blocks(blocksize=AUDIO_BLOCK_FRAMES, dtype="float32", always_2d=True):
+                n = min(len(block), len(audio) - pos)
+                if block.shape[1] > 1:
+                    np.mean(block[:n], axis=1, out=audio[pos:pos + n])
+                else:
+                    audio[pos:pos + n] = block[:n, 0]
+                pos += n
+        
+        return audio[:pos], sr
+    
+    def _read_audio_head(self, audio_path: str, seconds: int = 10):
+        """
+        Read the first `seconds` of audio at its native sample rate as mono float32
+        
+        soundfile reads the frames directly without librosa's audioread/resample
+        path. Formats libsndfile cannot open (mp4, m4a, ...) go through librosa.
+        """
+        if SOUNDFILE_AVAILABLE:
+            try:
+                with sf.SoundFile(audio_path) as f:
+                    sr = f.samplerate
+                    frames = f.read(min(f.frames, sr * seconds), dtype="float32", always_2d=False)
+                if frames.ndim > 1:
+                    frames = frames.mean(axis=1)
+                return frames, sr
+            except RuntimeError:
+                if not LIBROSA_AVAILABLE:
+                    raise
+        
+        return librosa.load(audio_path, sr=None, duration=seconds)
+    
     async def speech_to_text(self, audio_path: str, language: Optional[str] = None) -> Dict[str, any]:
         """
         Convert speech to text using Whisper
@@ -236,89 +930,195 @@ class ProductionSpeechEngine:
         Returns:
             Dict with transcription results
         """
-        if not WHISPER_AVAILABLE:
+        if not STT_AVAILABLE:
             raise RuntimeError("Whisper STT not available")
         
-        # Validate audio file
-        validation = self.validate_audio_file(audio_path)
-        if not validation["is_valid"]:
-            raise ValueError(f"Invalid audio file: {validation.get('error', 'Unknown error')}")
+        # "auto" and no hint mean the same thing, to the backend and to the cache key
+        language = language if language and language != "auto" else None
         
-        # Load model if needed
-        if not self.load_whisper_model():
-            raise RuntimeError("Failed to load Whisper model")
+        # Retries and resubmits of the same audio are served from the transcript cache
+        cache_key = None
+        if settings.STT_CACHE_SIZE > 0 and os.path.isfile(audio_path):
+            cache_key = (await asyncio.to_thread(_hash_audio_file, audio_path), language or "")
+            cached = self._stt_cache.get(cache_key)
+            if cached is not None:
+                self._stt_cache.move_to_end(cache_key)
+                app_logger.debug("STT cache hit: {}", Path(audio_path).name)
+                return {**cached, "cache_hit": True}
+        
+        audio, validation = await self._prepare_stt_input(audio_path)
         
         try:
             start_time = time.time()
             app_logger.info(f"Starting STT for: {Path(audio_path).name}")
             
-            # Transcribe with optimized options
-            result = self.whisper_model.transcribe(
-                audio_path,
-                language=language if language and language != "auto" else None,
-                fp16=TORCH_AVAILABLE and torch.cuda.is_available(),
-                verbose=False,
-                beam_size=5,
-                best_of=5,
-                temperature=0.0,  # Deterministic output
-            )
+            if self.stt_backend == "hf_batched" and settings.STT_MICRO_BATCHING:
+                # Share pipeline calls with other requests arriving in the same window
+                result = await self._stt_batcher.submit(language, audio)
+            else:
+                # Transcribe with optimized options; off the event loop so concurrent requests overlap
+                result = await self._run_stt(
+                    self._transcribe, audio, language=language, **self._stt_decode_options()
+                )
             
             duration = time.time() - start_time
-            
-            # Extract key information
-            transcription = {
-                "text": result["text"].strip(),
-                "language": result.get("language", "unknown"),
-                "confidence": self._calculate_confidence(result.get("segments", [])),
-                "duration": duration,
-                "file_duration": validation.get("duration_seconds", 0),
-                "segments": [
-                    {
-                        "start": seg.get("start", 0),
-                        "end": seg.get("end", 0),
-                        "text": seg.get("text", "").strip()
-                    }
-                    for seg in result.get("segments", [])
-                ]
-            }
+            transcription = self._build_transcription(
+                result["text"], result.get("language", "unknown"), result.get("segments", []), duration, validation
+            )
             
             app_logger.info(f"STT completed in {duration:.2f}s, detected language: {transcription['language']}")
             
+            if cache_key is not None:
+                self._stt_cache[cache_key] = dict(transcription)
+                if len(self._stt_cache) > settings.STT_CACHE_SIZE:
+                    self._stt_cache.popitem(last=False)
+            
             return transcription
             
         except Exception as e:
             app_logger.error(f"STT processing failed: {e}")
             raise RuntimeError(f"Speech-to-text failed: {str(e)}") from e
     
+    async def speech_to_text_stream(
+        self,
+        audio_path: str,
+        language: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Transcribe audio, yielding each segment as soon as it is decoded
+        
+        Yields {"partial": str, "start": float, "end": float} per segment, then one
+        {"done": True, "result": dict} event shaped like speech_to_text's return.
+        Only faster-whisper decodes incrementally; other backends emit all segments
+        once transcription finishes.
+        """
+        if not STT_AVAILABLE:
+            raise RuntimeError("Whisper STT not available")
+        
+        audio, validation = await self._prepare_stt_input(audio_path)
+        
+        start_time = time.time()
+        app_logger.info(f"Starting streaming STT for: {Path(audio_path).name}")
+        
+        segments, detected_language = await self._run_stt(
+            self._transcribe_lazy,
+            audio,
+            language if language and language != "auto" else None,
+            **self._stt_decode_options()
+        )
+        
+        decoded = []
+        while True:
+            segment = await self._run_stt(next, segments, None)
+            if segment is None:
+                break
+            decoded.append(segment)
+            yield {"partial": segment["text"].strip(), "start": segment["start"], "end": segment["end"]}
+        
+        duration = time.time() - start_time
+        text = "".join(segment["text"] for segment in decoded)
+        app_logger.info(f"Streaming STT completed in {duration:.2f}s, detected language: {detected_language}")
+        
+        yield {
+            "done": True,
+            "result": self._build_transcription(text, detected_language, decoded, duration, validation)
+        }
+    
+    async def _prepare_stt_input(self, audio_path: str) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Decode, validate and make sure a Whisper model is loaded
+        
+        Returns (16kHz samples, or the path when decoding was not possible, validation dict).
+        """
+        # Decode once; the same samples feed validation and transcription
+        audio = None
+        if (
+            os.path.exists(audio_path)
+            and os.path.getsize(audio_path) <= 100 * 1024 * 1024
+            and Path(audio_path).suffix.lower() in self.supported_formats
+        ):
+            try:
+                audio = await asyncio.to_thread(self._load_audio_16k, audio_path)
+            except Exception as e:
+                app_logger.warning(f"Audio decode failed, transcribing from path: {e}")
+        
+        # Validate audio file
+        validation = self.validate_audio_file(audio_path, audio=audio)
+        if not validation["is_valid"]:
+            if validation.get("is_silent", False):
+                raise ValueError("Audio file appears to contain only silence or very low audio")
+            if "sample_rate" in validation and validation["sample_rate"] < 8000:
+                raise ValueError("Audio sample rate too low (minimum 8kHz required)")
+            raise ValueError(f"Invalid audio file: {validation.get('error', 'Unknown error')}")
+        
+        # Load model if needed
+        if not await asyncio.to_thread(self.load_whisper_model):
+            raise RuntimeError("Failed to load Whisper model")
+        
+        return (audio if audio is not None else audio_path), validation
+    
+    def _stt_decode_options(self) -> Dict[str, Any]:
+        """openai-whisper decode options shared by the buffered and streaming STT paths"""
+        return {
+            "verbose": False,
+            "beam_size": settings.STT_BEAM_SIZE,
+            "best_of": settings.STT_BEAM_SIZE
+        }
+    
+    def _build_transcription(
+        self,
+        text: str,
+        language: str,
+        segments: list,
+        duration: float,
+        validation: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """speech_to_text response dict from decoded segments"""
+        return {
+            "text": text.strip(),
+            "language": language or "unknown",
+            "confidence": self._calculate_confidence(segments),
+            "duration": duration,
+            "file_duration": validation.get("duration_seconds", 0),
+            "segments": [
+                {"start": start, "end": end, "text": segment_text.strip()}
+                for start, end, segment_text in map(_segment_fields, segments)
+            ]
+        }
+    
     def _calculate_confidence(self, segments: list) -> float:
         """Calculate average confidence from segments"""
         if not segments:
             return 0.0
         
-        # Whisper doesn't always provide confidence scores
-        # Use segment length and other heuristics
-        total_prob = 0.0
-        total_segments = len(segments)
+        # Convert log probabilities to confidence in one vectorized pass
+        logprobs = np.fromiter(
+            (seg.get("avg_logprob", np.nan) for seg in segments), dtype=np.float32, count=len(segments)
+        )
+        confidences = np.clip(np.exp(logprobs), 0.0, 1.0)
         
-        for seg in segments:
-            # Use segment probability if available
-            if "avg_logprob" in seg:
-                # Convert log probability to confidence (rough approximation)
-                if LIBROSA_AVAILABLE:
-                    confidence = max(0.0, min(1.0, np.exp(seg["avg_logprob"])))
-                else:
-                    # Simple approximation without numpy
-                    confidence = max(0.0, min(1.0, 1.0 + seg["avg_logprob"] / 10.0))
-                total_prob += confidence
-            else:
-                # Default confidence based on text length
-                text_len = len(seg.get("text", "").strip())
-                total_prob += min(0.9, text_len / 50.0)  # Longer text = higher confidence
+        # Whisper doesn't always provide confidence scores (e.g. hf_batched chunks):
+        # fall back to text length, longer text = higher confidence
+        missing = np.isnan(logprobs)
+        if missing.any():
+            text_lengths = np.fromiter(
+                (len(seg.get("text", "").strip()) for seg in segments), dtype=np.float32, count=len(segments)
+            )
+            confidences = np.where(missing, np.minimum(0.9, text_lengths / 50.0), confidences)
         
-        return total_prob / total_segments if total_segments > 0 else 0.0
+        return float(confidences.mean())
     
     def load_tts_model(self) -> bool:
-        """Load VITS/Tacotron2 + HiFi-GAN TTS model as specified"""
+        """Load VITS/Tacotron2 + HiFi-GAN TTS model as specified (thread-safe, idempotent)"""
+        if self.tts_model is not None:
+            return True
+        
+        # Requests offload this to worker threads; only one of them loads the model
+        with self._tts_load_lock:
+            return self._load_tts_model()
+    
+    def _load_tts_model(self) -> bool:
+        """Try the configured TTS models in order of preference"""
         if self.tts_model is not None:
             return True
         
@@ -349,6 +1149,9 @@ class ProductionSpeechEngine:
                     self.tts_model_name = model_name
                     self.tts_is_multilingual = "multilingual" in model_name.lower()
                     
+                    if self.device == "cpu":
+                        self._script_tts_vocoder()
+                    
                     load_time = time.time() - start_time
                     app_logger.info(f"TTS model {model_name} loaded successfully in {load_time:.2f}s")
                     app_logger.info(f"Model is multilingual: {self.tts_is_multilingual}")
@@ -368,6 +1171,28 @@ class ProductionSpeechEngine:
             self.tts_model = None
             return False
 
+    def _script_tts_vocoder(self) -> None:
+        """
+        Compile the loaded vocoder (HiFi-GAN) forward with TorchScript for CPU inference
+        
+        The vocoder's stacks of 1D (transposed) convolutions are dominated by
+        interpreter overhead on CPU. Coqui calls vocoder.inference(), which the
+        scripted module does not expose, so only forward is swapped for the
+        scripted one. Models without a separate vocoder (XTTS) or that are not
+        script-safe are left as they are.
+        """
+        synthesizer = getattr(self.tts_model, "synthesizer", None)
+        vocoder = getattr(synthesizer, "vocoder_model", None)
+        if vocoder is None:
+            return
+        
+        try:
+            scripted = torch.jit.script(vocoder.eval())
+            vocoder.forward = scripted.forward
+            app_logger.info("TTS vocoder compiled with TorchScript")
+        except Exception as e:
+            app_logger.debug("TTS vocoder is not TorchScript-compatible: {}", e)
+    
     async def text_to_speech(self, text: str, language: str, output_path: str = None) -> Dict[str, any]:
         """
         Convert text to speech using VITS/Tacotron2 + HiFi-GAN (production TTS)
@@ -375,7 +1200,8 @@ class ProductionSpeechEngine:
         Args:
             text: Text to convert
             language: Language code
-            output_path: Optional output file path
+            output_path: Optional output file path. When omitted the audio goes to a
+                memory-backed temp dir and the caller deletes it once copied or sent.
             
         Returns:
             Dict with TTS results
@@ -383,67 +1209,48 @@ class ProductionSpeechEngine:
         if not text or not text.strip():
             raise ValueError("Text cannot be empty")
         
-        if language not in SUPPORTED_LANGUAGES and language != "en":
+        if language not in _SUPPORTED_CODES:
             raise ValueError(f"Language '{language}' not supported for TTS")
         
         try:
             start_time = time.time()
             
-            # Create output path if not provided
+            # Create output path if not provided; ephemeral outputs stay in tmpfs
             if not output_path:
-                timestamp = int(time.time())
+                timestamp = time.time_ns()
                 filename = f"tts_output_{timestamp}.mp3"
-                output_path = os.path.join(settings.OUTPUT_DIR, filename)
-            
-            # Ensure output directory exists
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+                output_path = os.path.join(EPHEMERAL_AUDIO_DIR, filename)
             
             app_logger.info(f"Generating TTS for {len(text)} characters in {language}")
             
             # Try advanced TTS first (VITS/Tacotron2)
-            if self.load_tts_model():
+            if await asyncio.to_thread(self.load_tts_model):
                 try:
                     # Check if model supports the language
                     if self.tts_is_multilingual and language != "en":
-                        # Language mapping for multilingual TTS
-                        tts_lang_map = {
-                            "hi": "hi", "bn": "bn", "ta": "ta", "te": "te", "mr": "mr",
-                            "gu": "gu", "kn": "kn", "ml": "ml", "pa": "pa", "ur": "ur",
-                            "en": "en"
-                        }
-                        
-                        tts_lang = tts_lang_map.get(language, "en")
+                        tts_lang = _TTS_LANG_MAP.get(language, "en")
                         
                         # Generate with multilingual VITS
-                        self.tts_model.tts_to_file(
-                            text=text,
-                            language=tts_lang,
-                            file_path=output_path
-                        )
+                        await self._synthesize(text, tts_lang, output_path)
                         
                         model_used = f"VITS Multilingual ({self.tts_model_name})"
                         
                     elif language == "en":
                         # English-only model or English text
-                        self.tts_model.tts_to_file(
-                            text=text,
-                            file_path=output_path
-                        )
+                        await self._synthesize(text, None, output_path)
                         
                         model_used = f"VITS English ({self.tts_model_name})"
                         
                     else:
                         # Non-English language with English-only model - use fallback
-                        app_logger.warning(f"Model {self.tts_model_name} doesn't support {language}, using gTTS fallback")
-                        return await self._fallback_gtts(text, language, output_path, start_time)
+                        app_logger.warning(f"Model {self.tts_model_name} doesn't support {language}, using fallback TTS")
+                        return await self._fallback_tts(text, language, output_path, start_time)
                     
                 except Exception as e:
-                    app_logger.warning(f"Advanced TTS failed, falling back to gTTS: {e}")
-                    # Fallback to gTTS
-                    return await self._fallback_gtts(text, language, output_path, start_time)
+                    app_logger.warning(f"Advanced TTS failed, using fallback TTS: {e}")
+                    return await self._fallback_tts(text, language, output_path, start_time)
             else:
-                # Fallback to gTTS
-                return await self._fallback_gtts(text, language, output_path, start_time)
+                return await self._fallback_tts(text, language, output_path, start_time)
             
             duration = time.time() - start_time
             file_size = os.path.getsize(output_path)
@@ -473,30 +1280,105 @@ class ProductionSpeechEngine:
             app_logger.error(f"TTS generation failed: {e}")
             raise RuntimeError(f"Text-to-speech failed: {str(e)}") from e
 
+    async def _synthesize(self, text: str, tts_lang: Optional[str], output_path: str) -> None:
+        """Synthesize one text to output_path with the Coqui model, off the event loop"""
+        await asyncio.to_thread(self._synthesize_locked, text, tts_lang, output_path)
+    
+    def _synthesize_locked(self, text: str, tts_lang: Optional[str], output_path: str) -> None:
+        """
+        Blocking Coqui synthesis, one request at a time
+        
+        Coqui's TTS API has no multi-text forward, so concurrent requests are
+        serialized on _tts_synth_lock rather than coalesced into a batch.
+        """
+        with self._tts_synth_lock, torch.inference_mode() if TORCH_AVAILABLE else contextlib.nullcontext():
+            self._synthesize_one(text, tts_lang, output_path)
+    
+    def _synthesize_one(self, text: str, tts_lang: Optional[str], output_path: str) -> None:
+        """Blocking Coqui synthesis of one text"""
+        if tts_lang is None:
+            self.tts_model.tts_to_file(text=text, file_path=output_path)
+        else:
+            self.tts_model.tts_to_file(text=text, language=tts_lang, file_path=output_path)
+    
+    async def _fallback_tts(self, text: str, language: str, output_path: str, start_time: float) -> Dict[str, any]:
+        """Local Piper voice when one is installed for the language, otherwise gTTS"""
+        voice = await asyncio.to_thread(self._load_piper_voice, language)
+        if voice is None:
+            return await self._fallback_gtts(text, language, output_path, start_time)
+        
+        try:
+            await asyncio.to_thread(self._synthesize_piper, voice, text, output_path)
+        except Exception as e:
+            app_logger.warning(f"Piper TTS failed for {language}, falling back to gTTS: {e}")
+            return await self._fallback_gtts(text, language, output_path, start_time)
+        
+        duration = time.time() - start_time
+        app_logger.info(f"Piper TTS completed in {duration:.2f}s for {language}")
+        
+        return {
+            "output_path": output_path,
+            "language": language,
+            "text_length": len(text),
+            "file_size_mb": os.path.getsize(output_path) / (1024 * 1024),
+            "generation_time": duration,
+            "model_used": f"Piper ({language})",
+            "success": True
+        }
+    
+    def _load_piper_voice(self, language: str) -> Optional[Any]:
+        """
+        Load and cache the Piper voice for language from PIPER_VOICE_DIR/<lang>.onnx
+        
+        Returns None when piper-tts is not installed or no voice file exists, so
+        the caller falls through to gTTS. On CUDA the ONNX Runtime session uses
+        the CUDA execution provider.
+        """
+        if not PIPER_AVAILABLE:
+            return None
+        
+        voice = self._piper_voices.get(language)
+        if voice is not None:
+            return voice
+        
+        model_path = Path(settings.PIPER_VOICE_DIR) / f"{language}.onnx"
+        if not model_path.is_file():
+            return None
+        
+        with self._tts_load_lock:
+            voice = self._piper_voices.get(language)
+            if voice is None:
+                try:
+                    voice = PiperVoice.load(str(model_path), use_cuda=self.device == "cuda")
+                except Exception as e:
+                    app_logger.warning(f"Failed to load Piper voice {model_path}: {e}")
+                    return None
+                self._piper_voices[language] = voice
+                app_logger.info(f"Loaded Piper voice for {language}")
+        return voice
+    
+    def _synthesize_piper(self, voice: Any, text: str, output_path: str) -> None:
+        """Blocking Piper synthesis to a WAV file"""
+        # piper-tts 1.3 renamed the file-writing call to synthesize_wav
+        synthesize = getattr(voice, "synthesize_wav", None) or voice.synthesize
+        with wave.open(output_path, "wb") as wav_file:
+            synthesize(text, wav_file)
+    
     async def _fallback_gtts(self, text: str, language: str, output_path: str, start_time: float) -> Dict[str, any]:
         """Fallback TTS using gTTS"""
         if not GTTS_AVAILABLE:
             raise RuntimeError("No TTS engine available")
         
-        # Language mapping for gTTS
-        tts_lang_map = {
-            "hi": "hi", "bn": "bn", "ta": "ta", "te": "te", "mr": "mr",
-            "gu": "gu", "kn": "kn", "ml": "ml", "pa": "pa", "ur": "ur",
-            "en": "en"
-        }
-        
-        gtts_lang = tts_lang_map.get(language, "en")
+        gtts_lang = _TTS_LANG_MAP.get(language, "en")
         
         # Ensure output is MP3 for better compatibility
         if not output_path.endswith('.mp3'):
             output_path = output_path.rsplit('.', 1)[0] + '.mp3'
         
-        # Generate speech
-        tts = gTTS(text=text, lang=gtts_lang, slow=False)
-        tts.save(output_path)
+        # Generate speech (network round-trip, so off the event loop)
+        file_size = await asyncio.to_thread(self._save_gtts, text, gtts_lang, output_path)
         
         duration = time.time() - start_time
-        file_size = os.path.getsize(output_path)
         
         app_logger.info(f"gTTS fallback completed in {duration:.2f}s for {language}")
         
@@ -510,10 +1392,58 @@ class ProductionSpeechEngine:
             "success": True
         }
     
+    def _save_gtts(self, text: str, gtts_lang: str, output_path: str) -> int:
+        """
+        Write gTTS audio for text to output_path; returns the byte count
+        
+        Each phrase costs a 200-800ms round-trip to Google, so MP3s are kept in a
+        content-addressed disk cache keyed by (language, text). Repeated phrases
+        become a file copy. The cache is bounded to GTTS_CACHE_SIZE files, evicting
+        the least recently used by mtime.
+        """
+        cache_path = None
+        if settings.GTTS_CACHE_SIZE > 0:
+            key = hashlib.blake2b(f"{gtts_lang}:{text}".encode("utf-8"), digest_size=16).hexdigest()
+            cache_path = GTTS_CACHE_DIR / f"{key}.mp3"
+            try:
+                shutil.copyfile(cache_path, output_path)
+                os.utime(cache_path)  # mark as recently used
+                return os.path.getsize(output_path)
+            except FileNotFoundError:
+                pass
+        
+        tts = gTTS(text=text, lang=gtts_lang, slow=False)
+        buffer = io.BytesIO()
+        tts.write_to_fp(buffer)
+        data = buffer.getbuffer()
+        with open(output_path, "wb") as f:
+            f.write(data)
+        
+        if cache_path is not None:
+            self._store_gtts_cache(cache_path, data)
+        return len(data)
+    
+    def _store_gtts_cache(self, cache_path: Path, data) -> None:
+        """Atomically add an MP3 to the gTTS cache, then evict the least recently used beyond the bound"""
+        try:
+            GTTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=GTTS_CACHE_DIR, suffix=".tmp", delete=False) as tmp:
+                tmp.write(data)
+            os.replace(tmp.name, cache_path)
+            
+            cached = list(GTTS_CACHE_DIR.glob("*.mp3"))
+            if len(cached) > settings.GTTS_CACHE_SIZE:
+                cached.sort(key=lambda path: path.stat().st_mtime)
+                for stale in cached[:len(cached) - settings.GTTS_CACHE_SIZE]:
+                    stale.unlink(missing_ok=True)
+        except OSError as e:
+            app_logger.warning(f"gTTS cache write failed: {e}")
+    
     async def speech_to_text_with_timestamps(
         self, 
         audio_path: str, 
-        language: Optional[str] = None
+        language: Optional[str] = None,
+        word_timestamps: bool = False
     ) -> Dict[str, Union[str, float, list]]:
         """
         Convert speech to text with detailed timestamps for subtitle generation
@@ -521,29 +1451,37 @@ class ProductionSpeechEngine:
         Args:
             audio_path: Path to audio file
             language: Optional language code
+            word_timestamps: Also align individual words; subtitles only need segment times
         
         Returns:
             Dict with text, language, duration, and segments with timestamps
         """
-        if not WHISPER_AVAILABLE:
+        if not STT_AVAILABLE:
             raise ValueError("Whisper not available for STT with timestamps")
         
         try:
             # Load Whisper model
-            if not self.load_whisper_model():
+            if not await asyncio.to_thread(self.load_whisper_model):
                 raise ValueError("Failed to load Whisper model")
             
             app_logger.info(f"Processing STT with timestamps: {audio_path}")
             start_time = time.time()
             
-            # Transcribe with word-level timestamps
-            options = {
-                "language": language,
-                "word_timestamps": True,
-                "verbose": False
-            }
+            # Feed samples, not the path: the backend would otherwise spawn its own ffmpeg decode
+            try:
+                audio = await asyncio.to_thread(self._load_audio_16k, audio_path)
+            except Exception as e:
+                app_logger.warning(f"Audio decode failed, transcribing from path: {e}")
+                audio = None
             
-            result = self.whisper_model.transcribe(audio_path, **options)
+            # Segment timestamps come for free; word alignment is an extra DTW pass
+            result = await self._run_stt(
+                self._transcribe,
+                audio if audio is not None else audio_path,
+                language=language,
+                word_timestamps=word_timestamps,
+                verbose=False
+            )
             
             processing_time = time.time() - start_time
             
@@ -781,10 +1719,10 @@ class ProductionSpeechEngine:
     def get_supported_languages(self) -> Dict[str, any]:
         """Get supported languages for speech processing"""
         return {
-            "stt_languages": list(SUPPORTED_LANGUAGES.keys()) + ["en"],
-            "tts_languages": list(SUPPORTED_LANGUAGES.keys()) + ["en"],
-            "total_languages": len(SUPPORTED_LANGUAGES) + 1,
-            "whisper_available": WHISPER_AVAILABLE,
+            "stt_languages": list(SUPPORTED_LANGUAGES),
+            "tts_languages": list(SUPPORTED_LANGUAGES),
+            "total_languages": len(_SUPPORTED_CODES),
+            "whisper_available": STT_AVAILABLE,
             "advanced_tts_available": TTS_AVAILABLE,
             "fallback_tts_available": GTTS_AVAILABLE,
             "models": {
@@ -801,13 +1739,32 @@ class ProductionSpeechEngine:
             "device": self.device,
             "torch_available": TORCH_AVAILABLE,
             "cuda_available": TORCH_AVAILABLE and torch.cuda.is_available(),
-            "whisper_available": WHISPER_AVAILABLE,
+            "whisper_available": STT_AVAILABLE,
+            "stt_backend": self.stt_backend,
             "gtts_available": GTTS_AVAILABLE,
+            "piper_voices": sorted(self._piper_voices),
             "librosa_available": LIBROSA_AVAILABLE,
             "supported_formats": self.supported_formats,
             "model_cache_size": len(self.model_cache)
         }
     
+    async def warmup(self) -> Dict[str, bool]:
+        """
+        Load the STT and TTS models off the event loop so the first request skips the cold start
+        
+        load_whisper_model runs its silent warm-up decodes as part of the load.
+        """
+        status = {"stt": False, "tts": False}
+        
+        if STT_AVAILABLE:
+            status["stt"] = await asyncio.to_thread(self.load_whisper_model)
+        
+        if TTS_AVAILABLE:
+            status["tts"] = await asyncio.to_thread(self.load_tts_model)
+        
+        app_logger.info(f"Speech models warmed up: {status}")
+        return status
+    
     def cleanup(self):
         """Clean up resources"""
         try:
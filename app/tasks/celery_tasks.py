@@ -71,7 +71,8 @@ def translate_text_task(
         )
         
         # Import here to avoid circular imports
-        from app.services.nlp_engine import nlp_engine
+        from app.services.nlp_engine import get_nlp_engine
+        nlp_engine = get_nlp_engine()
         
         app_logger.info(f"Starting translation task: {source_lang} -> {target_lang}")
         
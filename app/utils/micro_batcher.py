@@ -0,0 +1,112 @@
+"""
+Async micro-batching
+Coalesces concurrent requests into batched model calls
+"""
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple, Union
+
+from app.utils.logger import app_logger
+
+
+BatchHandler = Callable[[Hashable, List[Any]], Union[List[Any], Awaitable[List[Any]]]]
+
+
+class MicroBatcher:
+    """
+    Collects items submitted within a short window and processes them together
+
+    Items are bucketed by key (e.g. a language pair) so each handler call sees a
+    homogeneous batch. A single background task drains the queue: it waits for
+    the first item, keeps collecting until max_batch_size items or max_wait_ms
+    have elapsed, then calls the handler once per key and resolves every
+    caller's future with its own result.
+    """
+
+    def __init__(
+        self,
+        handler: BatchHandler,
+        max_batch_size: int = 16,
+        max_wait_ms: float = 10.0,
+        name: str = "batcher"
+    ):
+        """
+        Args:
+            handler: Called as handler(key, items); must return one result per item,
+                in order. May be sync or async.
+            max_batch_size: Maximum items collected per drain
+            max_wait_ms: How long to wait for more items after the first arrives
+            name: Label used in log messages
+        """
+        self.handler = handler
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.name = name
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _ensure_worker(self) -> None:
+        """Start the drain task on the running loop (restarting it if the loop changed)"""
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+
+    async def submit(self, key: Hashable, item: Any) -> Any:
+        """Queue an item and wait for its result"""
+        self._ensure_worker()
+        future = self._loop.create_future()
+        await self._queue.put((key, item, future))
+        return await future
+
+    async def _collect(self) -> List[Tuple[Hashable, Any, asyncio.Future]]:
+        """Wait for one item, then gather more until the batch is full or the window closes"""
+        pending = [await self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+
+        while len(pending) < self.max_batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                pending.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return pending
+
+    async def _run(self) -> None:
+        """Background drain loop"""
+        while True:
+            pending = await self._collect()
+
+            buckets: Dict[Hashable, List[Tuple[Any, asyncio.Future]]] = {}
+            for key, item, future in pending:
+                buckets.setdefault(key, []).append((item, future))
+
+            for key, entries in buckets.items():
+                await self._process_bucket(key, entries)
+
+    async def _process_bucket(self, key: Hashable, entries: List[Tuple[Any, asyncio.Future]]) -> None:
+        """Run the handler for one key and fan results back to the waiting callers"""
+        items = [item for item, _ in entries]
+        try:
+            results = self.handler(key, items)
+            if asyncio.iscoroutine(results):
+                results = await results
+            if len(results) != len(items):
+                raise RuntimeError(f"{self.name} handler returned {len(results)} results for {len(items)} items")
+        except Exception as e:
+            app_logger.error(f"{self.name} batch for {key} failed: {e}")
+            for _, future in entries:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        app_logger.debug("{} processed {} item(s) for {}", self.name, len(items), key)
+        for (_, future), result in zip(entries, results):
+            if not future.done():
+                future.set_result(result)
@@ -351,8 +351,8 @@ def optimize_torch_settings():
 @lru_cache(maxsize=1000)
 def cached_language_detection(text_hash: str, text: str) -> Dict[str, Any]:
     """Cached language detection to avoid repeated computation"""
-    from app.services.nlp_engine import nlp_engine
-    return nlp_engine.detect_language(text)
+    from app.services.nlp_engine import get_nlp_engine
+    return get_nlp_engine().detect_language(text)
 
 
 def cleanup_resources():
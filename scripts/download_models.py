@@ -5,7 +5,8 @@ Model Download and Setup Script for Indian Language Localizer Backend
 This script downloads and sets up all required models for the translation service:
 - IndicTrans2 EN-Indic model for English to Indian languages
 - IndicTrans2 Indic-EN model for Indian languages to English
-- Whisper large-v3 for speech recognition
+- IndicTrans2 Indic-Indic model for direct Indian-to-Indian translation
+- Whisper large-v3 for speech recognition (faster-whisper CTranslate2 format by default)
 
 Models are saved to the saved_model directory for local caching.
 """
@@ -17,7 +18,11 @@ from pathlib import Path
 from huggingface_hub import snapshot_download
 import torch
 from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
-import whisper
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from app.core.config import get_settings
+
+settings = get_settings()
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -26,19 +31,24 @@ logger = logging.getLogger(__name__)
 # Model configurations
 MODELS = {
     "indicTrans2_en_indic": {
-        "repo_id": "ai4bharat/IndicTrans2-en-indic-1B",
-        "local_dir": "saved_model/IndicTrans2-en-indic-1B",
+        "repo_id": settings.TRANSLATION_MODEL,
+        "local_dir": f"saved_model/{settings.TRANSLATION_MODEL.split('/')[-1]}",
         "description": "IndicTrans2 English to Indian Languages"
     },
     "indicTrans2_indic_en": {
-        "repo_id": "ai4bharat/IndicTrans2-indic-en-1B", 
-        "local_dir": "saved_model/IndicTrans2-indic-en-1B",
+        "repo_id": settings.TRANSLATION_MODEL_INDIC_EN,
+        "local_dir": f"saved_model/{settings.TRANSLATION_MODEL_INDIC_EN.split('/')[-1]}",
         "description": "IndicTrans2 Indian Languages to English"
     },
-    "whisper_large_v3": {
+    "indicTrans2_indic_indic": {
+        "repo_id": settings.TRANSLATION_MODEL_INDIC_INDIC,
+        "local_dir": f"saved_model/{settings.TRANSLATION_MODEL_INDIC_INDIC.split('/')[-1]}",
+        "description": "IndicTrans2 Indian Languages to Indian Languages"
+    },
+    "whisper": {
         "model_name": "large-v3",
-        "local_dir": "saved_model/whisper-large-v3",
-        "description": "Whisper Large V3 for Speech Recognition"
+        "local_dir": "models/whisper",  # download_root used by the speech engines
+        "description": f"Whisper large-v3 ({settings.STT_BACKEND}) for Speech Recognition"
     }
 }
 
@@ -55,7 +65,7 @@ def create_directories():
 
 def download_indicTrans2_models():
     """Download IndicTrans2 models from Hugging Face"""
-    for model_key in ["indicTrans2_en_indic", "indicTrans2_indic_en"]:
+    for model_key in ["indicTrans2_en_indic", "indicTrans2_indic_en", "indicTrans2_indic_indic"]:
         model_config = MODELS[model_key]
         
         logger.info(f"Downloading {model_config['description']}...")
@@ -89,18 +99,98 @@ def download_indicTrans2_models():
     
     return True
 
+def convert_indicTrans2_to_ctranslate2():
+    """Convert the downloaded IndicTrans2 models to CTranslate2 format (TRANSLATION_BACKEND=ctranslate2)"""
+    try:
+        import ctranslate2
+    except ImportError:
+        logger.error("❌ ctranslate2 is not installed - pip install ctranslate2")
+        return False
+    
+    for model_key in ["indicTrans2_en_indic", "indicTrans2_indic_en"]:
+        model_config = MODELS[model_key]
+        output_dir = f"{model_config['local_dir']}-ct2"
+        
+        logger.info(f"Converting {model_config['description']} to CTranslate2...")
+        
+        try:
+            converter = ctranslate2.converters.TransformersConverter(
+                model_config["local_dir"],
+                trust_remote_code=True
+            )
+            converter.convert(
+                output_dir,
+                quantization="int8_float16" if torch.cuda.is_available() else "int8",
+                force=True
+            )
+            logger.info(f"✅ {model_config['description']} converted to {output_dir}")
+            
+        except Exception as e:
+            logger.error(f"❌ Failed to convert {model_config['description']}: {e}")
+            return False
+    
+    return True
+
+def export_indicTrans2_to_onnx():
+    """Export the downloaded IndicTrans2 models to ONNX Runtime format (TRANSLATION_BACKEND=onnxruntime)"""
+    try:
+        from optimum.onnxruntime import ORTModelForSeq2SeqLM, ORTOptimizer, ORTQuantizer
+        from optimum.onnxruntime.configuration import OptimizationConfig, AutoQuantizationConfig
+    except ImportError:
+        logger.error("❌ optimum[onnxruntime] is not installed - pip install optimum[onnxruntime]")
+        return False
+    
+    for model_key in ["indicTrans2_en_indic", "indicTrans2_indic_en"]:
+        model_config = MODELS[model_key]
+        output_dir = Path(f"{model_config['local_dir']}-onnx")
+        
+        logger.info(f"Exporting {model_config['description']} to ONNX...")
+        
+        try:
+            model = ORTModelForSeq2SeqLM.from_pretrained(
+                model_config["local_dir"],
+                export=True,
+                trust_remote_code=True
+            )
+            model.save_pretrained(output_dir)
+            
+            # Fuse attention/GELU/LayerNorm kernels
+            optimizer = ORTOptimizer.from_pretrained(model)
+            optimizer.optimize(
+                save_dir=output_dir,
+                optimization_config=OptimizationConfig(optimization_level=2)
+            )
+            
+            # INT8 dynamic quantization for CPU serving
+            if not torch.cuda.is_available():
+                qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+                for onnx_file in output_dir.glob("*_optimized.onnx"):
+                    quantizer = ORTQuantizer.from_pretrained(output_dir, file_name=onnx_file.name)
+                    quantizer.quantize(save_dir=output_dir, quantization_config=qconfig)
+            
+            logger.info(f"✅ {model_config['description']} exported to {output_dir}")
+            
+        except Exception as e:
+            logger.error(f"❌ Failed to export {model_config['description']}: {e}")
+            return False
+    
+    return True
+
 def download_whisper_model():
-    """Download Whisper large-v3 model"""
-    model_config = MODELS["whisper_large_v3"]
+    """Download the Whisper checkpoint for the configured STT_BACKEND"""
+    model_config = MODELS["whisper"]
     
     logger.info(f"Downloading {model_config['description']}...")
     
     try:
-        # Download Whisper model
-        model = whisper.load_model(
-            model_config["model_name"],
-            download_root=model_config["local_dir"]
-        )
+        if settings.STT_BACKEND == "faster_whisper":
+            # CTranslate2 checkpoint, cached where WhisperModel(download_root=...) looks
+            from faster_whisper import download_model
+            download_model(model_config["model_name"], cache_dir=model_config["local_dir"])
+        else:
+            # hf_batched checkpoints are fetched into the HF cache on first load
+            import whisper
+            whisper.load_model(model_config["model_name"], download_root=model_config["local_dir"])
         
         logger.info(f"✅ {model_config['description']} downloaded successfully")
         return True
@@ -139,6 +229,14 @@ def main():
     indicTrans2_success = download_indicTrans2_models()
     whisper_success = download_whisper_model()
     
+    # Optional CTranslate2 conversion
+    if "--ctranslate2" in sys.argv and indicTrans2_success:
+        indicTrans2_success = convert_indicTrans2_to_ctranslate2()
+    
+    # Optional ONNX Runtime export
+    if "--onnx" in sys.argv and indicTrans2_success:
+        indicTrans2_success = export_indicTrans2_to_onnx()
+    
     # Verify installations
     verification_success = verify_models()
     